@@ -0,0 +1,25 @@
+"""Ferramentas de análise e geração de jogos da Lotofácil.
+
+Importar o pacote não carrega nenhum submódulo nem numpy, pandas ou matplotlib: cada submódulo
+é importado no primeiro acesso (lotofacil.jogo, lotofacil.fechamento, ...), e dentro deles as
+bibliotecas pesadas só são importadas pelos caminhos que as usam.
+"""
+import importlib
+
+SUBMODULOS = (
+    'amostragem', 'atraso', 'backtest', 'benchmark', 'busca', 'conferencia', 'coocorrencia', 'espaco',
+    'estatisticas', 'fechamento', 'graficocand', 'graficos', 'jogo', 'memoria', 'numedestino', 'padroes',
+    'perfil', 'servico', 'sorteios', 'tipos',
+)
+
+__all__ = list(SUBMODULOS)
+
+
+def __getattr__(nome):
+    if nome in SUBMODULOS:
+        return importlib.import_module(f'{__name__}.{nome}')
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(SUBMODULOS))
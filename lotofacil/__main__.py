@@ -0,0 +1,32 @@
+"""Linha de comando: python -m lotofacil <ferramenta> [argumentos da ferramenta]."""
+import importlib
+import sys
+
+# Ferramenta -> submódulo com a função main(argv); o submódulo só é importado se for escolhido.
+FERRAMENTAS = {
+    'jogo': 'jogo',
+    'padroes': 'padroes',
+    'backtest': 'backtest',
+    'busca': 'busca',
+    'benchmark': 'benchmark',
+    'fechamento': 'fechamento',
+    'numedestino': 'numedestino',
+    'candles': 'graficocand',
+    'servico': 'servico',
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in FERRAMENTAS:
+        print("Uso: python -m lotofacil {" + ",".join(FERRAMENTAS) + "} [argumentos]")
+        print("Ajuda de cada ferramenta: python -m lotofacil <ferramenta> --help")
+        return 0 if argv and argv[0] in ('-h', '--help') else 2
+    modulo = importlib.import_module(f'{__package__}.{FERRAMENTAS[argv[0]]}')
+    sys.argv[0] = f'lotofacil {argv[0]}'
+    modulo.main(argv[1:])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
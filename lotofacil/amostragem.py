@@ -0,0 +1,117 @@
+import random
+from functools import lru_cache
+from math import comb
+import numpy as np
+from . import sorteios
+
+PARES = list(range(2, 26, 2))
+IMPARES = list(range(1, 26, 2))
+SOMA_MINIMA = sum(range(1, 16))
+SOMA_MAXIMA = sum(range(11, 26))
+
+
+@lru_cache(maxsize=None)
+def _tabela_somas():
+    """formas[i, p, s]: quantas maneiras de escolher p números entre i e 25 com soma s."""
+    n = sorteios.NUMEROS
+    formas = np.zeros((n + 2, sorteios.DEZENAS_POR_SORTEIO + 1, SOMA_MAXIMA + 1), dtype=np.int64)
+    formas[n + 1, 0, 0] = 1
+    for num in range(n, 0, -1):
+        formas[num] = formas[num + 1]
+        formas[num, 1:, num:] += formas[num + 1, :-1, :-num]
+    return formas
+
+
+def _pesos_somas(soma_min, soma_max):
+    """Quantidade de combinações para cada soma da faixa, já limitada às somas possíveis."""
+    soma_min = max(int(soma_min), SOMA_MINIMA)
+    soma_max = min(int(soma_max), SOMA_MAXIMA)
+    if soma_min > soma_max:
+        raise ValueError(f"Nenhuma combinação com soma entre {soma_min} e {soma_max}")
+    return soma_min, _tabela_somas()[1, sorteios.DEZENAS_POR_SORTEIO, soma_min:soma_max + 1]
+
+
+def _pesos_pares(pares_min, pares_max):
+    """Quantidade de combinações para cada número de pares da faixa."""
+    pares_min = max(int(pares_min), sorteios.DEZENAS_POR_SORTEIO - len(IMPARES))
+    pares_max = min(int(pares_max), len(PARES))
+    if pares_min > pares_max:
+        raise ValueError(f"Nenhuma combinação com {pares_min} a {pares_max} pares")
+    pesos = [comb(len(PARES), p) * comb(len(IMPARES), sorteios.DEZENAS_POR_SORTEIO - p)
+             for p in range(pares_min, pares_max + 1)]
+    return pares_min, np.array(pesos, dtype=np.int64)
+
+
+def _escolher_indice(pesos, rng):
+    """Sorteia um índice com probabilidade proporcional aos pesos inteiros."""
+    alvo = rng.randrange(int(pesos.sum()))
+    return int(np.searchsorted(np.cumsum(pesos), alvo, side='right'))
+
+
+def contar_combinacoes_por_soma(soma_min, soma_max):
+    """Quantas combinações de 15 números têm soma dentro da faixa."""
+    try:
+        return int(_pesos_somas(soma_min, soma_max)[1].sum())
+    except ValueError:
+        return 0
+
+
+def sortear_por_soma(soma_min, soma_max, rng=random):
+    """Sorteia, com distribuição uniforme, uma combinação com soma dentro da faixa (sem rejeição)."""
+    inicio, pesos = _pesos_somas(soma_min, soma_max)
+    if not pesos.any():
+        raise ValueError(f"Nenhuma combinação com soma entre {soma_min} e {soma_max}")
+    formas = _tabela_somas()
+    soma = inicio + _escolher_indice(pesos, rng)
+    restantes = sorteios.DEZENAS_POR_SORTEIO
+    combinacao = []
+    for num in range(1, sorteios.NUMEROS + 1):
+        if restantes == 0:
+            break
+        com_num = int(formas[num + 1, restantes - 1, soma - num]) if soma >= num else 0
+        if rng.randrange(int(formas[num, restantes, soma])) < com_num:
+            combinacao.append(num)
+            restantes -= 1
+            soma -= num
+    return combinacao
+
+
+def sortear_por_pares(pares_min, pares_max, rng=random):
+    """Sorteia, com distribuição uniforme, uma combinação com quantidade de pares dentro da faixa."""
+    inicio, pesos = _pesos_pares(pares_min, pares_max)
+    pares = inicio + _escolher_indice(pesos, rng)
+    return sorted(rng.sample(PARES, pares) + rng.sample(IMPARES, sorteios.DEZENAS_POR_SORTEIO - pares))
+
+
+def sortear_lote_por_soma(quantidade, soma_min, soma_max, gerador):
+    """Sorteia `quantidade` combinações com soma na faixa; retorna array uint8 (quantidade x 15)."""
+    inicio, pesos = _pesos_somas(soma_min, soma_max)
+    if not pesos.any():
+        raise ValueError(f"Nenhuma combinação com soma entre {soma_min} e {soma_max}")
+    formas = _tabela_somas()
+    soma = inicio + gerador.choice(len(pesos), size=quantidade, p=pesos / pesos.sum())
+    restantes = np.full(quantidade, sorteios.DEZENAS_POR_SORTEIO, dtype=np.int64)
+    combinacoes = np.zeros((quantidade, sorteios.DEZENAS_POR_SORTEIO), dtype=np.uint8)
+    linhas = np.arange(quantidade)
+    for num in range(1, sorteios.NUMEROS + 1):
+        total = formas[num, restantes, soma]
+        possivel = (restantes > 0) & (soma >= num)
+        com_num = np.where(possivel, formas[num + 1, np.maximum(restantes - 1, 0), np.maximum(soma - num, 0)], 0)
+        escolhido = gerador.integers(0, total) < com_num
+        combinacoes[linhas[escolhido], sorteios.DEZENAS_POR_SORTEIO - restantes[escolhido]] = num
+        restantes -= escolhido
+        soma -= num * escolhido
+    return combinacoes
+
+
+def sortear_lote_por_pares(quantidade, pares_min, pares_max, gerador):
+    """Sorteia `quantidade` combinações com pares na faixa; retorna array uint8 (quantidade x 15)."""
+    inicio, pesos = _pesos_pares(pares_min, pares_max)
+    pares = inicio + gerador.choice(len(pesos), size=quantidade, p=pesos / pesos.sum())
+    # Posição aleatória de cada par/ímpar: os `pares` primeiros pares e os demais ímpares entram.
+    ordem_pares = gerador.random((quantidade, len(PARES))).argsort(axis=1).argsort(axis=1)
+    ordem_impares = gerador.random((quantidade, len(IMPARES))).argsort(axis=1).argsort(axis=1)
+    incidencia = np.zeros((quantidade, sorteios.NUMEROS), dtype=bool)
+    incidencia[:, 1::2] = ordem_pares < pares[:, None]
+    incidencia[:, 0::2] = ordem_impares < (sorteios.DEZENAS_POR_SORTEIO - pares)[:, None]
+    return sorteios.incidencia_para_matriz(incidencia)
@@ -0,0 +1,94 @@
+import numpy as np
+from . import sorteios
+
+
+class Atrasos:
+    """Atraso (concursos sem sair) de cada número: atual, máximo e histograma das lacunas.
+
+    Guarda, por número, o índice do último sorteio em que saiu, o maior atraso já encerrado e o
+    histograma (25 x comprimento) das lacunas entre duas aparições seguidas (lacuna 0 = saiu em
+    sorteios consecutivos). O histórico inicial é processado em uma única passada vetorizada sobre
+    a matriz de incidência; incluir um sorteio custa O(25). O trecho antes da primeira aparição
+    de um número não é uma lacuna completa e só entra no atraso atual de quem nunca saiu.
+    """
+
+    def __init__(self, mascaras=None):
+        self.ultimo = np.full(sorteios.NUMEROS, -1, dtype=np.int64)
+        self.maximo = np.zeros(sorteios.NUMEROS, dtype=np.int64)
+        self.histogramas = np.zeros((sorteios.NUMEROS, 1), dtype=np.int64)
+        self.quantidade = 0
+        if mascaras is not None:
+            self.adicionar_lote(mascaras)
+
+    def __len__(self):
+        return self.quantidade
+
+    def adicionar(self, numeros):
+        """Inclui um sorteio (lista de números)."""
+        self.adicionar_lote(np.array([sorteios.codificar_sorteio(numeros)], dtype=np.uint32))
+
+    def adicionar_lote(self, mascaras):
+        """Inclui vários sorteios de uma vez, a partir das máscaras (ver sorteios.carregar_mascaras)."""
+        mascaras = np.asarray(mascaras, dtype=np.uint32)
+        if len(mascaras) == 0:
+            return
+        # Uma linha extra no topo marca a última aparição já conhecida de cada número, para que
+        # as lacunas que atravessam a fronteira com os sorteios anteriores também sejam contadas.
+        incidencia = np.vstack([self.ultimo >= 0, sorteios.mascaras_para_incidencia(mascaras)])
+        numeros, linhas = np.nonzero(incidencia.T)  # Ordenados por número e, dentro dele, por sorteio
+        posicoes = np.where(linhas == 0, self.ultimo[numeros], self.quantidade + linhas - 1)
+
+        mesmo_numero = numeros[1:] == numeros[:-1]
+        lacunas = (posicoes[1:] - posicoes[:-1] - 1)[mesmo_numero]
+        numeros_lacunas = numeros[1:][mesmo_numero]
+        if len(lacunas):
+            atual = self.histogramas.shape[1]
+            if lacunas.max() >= atual:
+                extra = max(int(lacunas.max()) + 1, 2 * atual) - atual
+                self.histogramas = np.pad(self.histogramas, ((0, 0), (0, extra)))
+            np.add.at(self.histogramas, (numeros_lacunas, lacunas), 1)
+            np.maximum.at(self.maximo, numeros_lacunas, lacunas)
+
+        ultimas = np.flatnonzero(np.append(~mesmo_numero, True))
+        self.ultimo[numeros[ultimas]] = posicoes[ultimas]
+        self.quantidade += len(mascaras)
+
+    def atuais(self):
+        """Atraso atual de cada número (posição 0 = número 1): 0 se saiu no último sorteio.
+
+        Números que nunca saíram têm atraso igual à quantidade de sorteios.
+        """
+        return np.where(self.ultimo >= 0, self.quantidade - 1 - self.ultimo, self.quantidade)
+
+    def maximos(self):
+        """Maior atraso de cada número, contando o atraso atual ainda em aberto."""
+        return np.maximum(self.maximo, self.atuais())
+
+    def aparicoes(self):
+        """Quantas vezes cada número saiu."""
+        return self.histogramas.sum(axis=1) + (self.ultimo >= 0)
+
+    def medias(self):
+        """Lacuna média de cada número entre aparições seguidas (NaN se saiu menos de duas vezes)."""
+        quantidades = self.histogramas.sum(axis=1)
+        somas = self.histogramas @ np.arange(self.histogramas.shape[1])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return somas / quantidades
+
+    def pesos(self, expoente=1.0):
+        """Pesos positivos para jogo.gerar_lote_por_pesos: (atraso atual + 1) ** expoente.
+
+        Com expoente > 0 favorece os números atrasados; com expoente < 0, os que saíram há pouco.
+        """
+        return (self.atuais() + 1.0) ** expoente
+
+    def tabela(self):
+        """DataFrame (índice = número) com atraso atual, máximo, médio e aparições."""
+        import pandas as pd
+
+        return pd.DataFrame({
+            'atraso_atual': self.atuais(),
+            'atraso_maximo': self.maximos(),
+            'atraso_medio': self.medias(),
+            'aparicoes': self.aparicoes(),
+        }, index=pd.RangeIndex(1, sorteios.NUMEROS + 1, name='numero'))
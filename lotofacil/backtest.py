@@ -0,0 +1,165 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from . import jogo
+from . import sorteios
+
+# Parâmetros das estratégias, os mesmos usados em jogo.main.
+FAIXA_SOMA = (180, 220)
+LINHAS_ESCOLHIDAS = {0: 2, 2: 3}
+COLUNAS_ESCOLHIDAS = [1, 4]
+
+# Cada estratégia recebe o histórico, a quantidade de bilhetes e o gerador, e devolve máscaras.
+ESTRATEGIAS = {
+    'mais_frequentes': lambda h, n, g: jogo.gerar_lote_mais_frequentes(n, g, h['frequencia'], formato='mascaras'),
+    'menos_frequentes': lambda h, n, g: jogo.gerar_lote_menos_frequentes(n, g, h['frequencia'], formato='mascaras'),
+    'mix_frequencias': lambda h, n, g: jogo.gerar_lote_mix_frequencias(n, g, h['frequencia'], formato='mascaras'),
+    'por_soma': lambda h, n, g: jogo.gerar_lote_por_soma(n, g, *FAIXA_SOMA, formato='mascaras'),
+    'mais_pares': lambda h, n, g: jogo.gerar_lote_por_pares_impares(n, g, mais_pares=True, formato='mascaras'),
+    'mais_impares': lambda h, n, g: jogo.gerar_lote_por_pares_impares(n, g, mais_pares=False, formato='mascaras'),
+    'por_distribuicao': lambda h, n, g: jogo.gerar_lote_por_distribuicao(n, g, LINHAS_ESCOLHIDAS, COLUNAS_ESCOLHIDAS,
+                                                                         formato='mascaras'),
+}
+
+FAIXAS_PREMIO = [11, 12, 13, 14, 15]
+
+# Histograma por estratégia: posições 0 a 15 contam acertos de bilhetes completos; a última
+# conta bilhetes com menos de 15 números (a estratégia não conseguiu completá-los, como
+# por_distribuicao com restrições que não fecham 15 dezenas), que não podem ser apostados.
+INCOMPLETOS = 16
+POSICOES = 17
+
+# Estado de cada processo de trabalho, montado uma única vez por inicializar_processo.
+_CONTEXTO = {}
+
+
+def inicializar_processo(mascaras):
+    """Prepara, no processo de trabalho, as estruturas derivadas do histórico.
+
+    Use como `initializer` de um ProcessPoolExecutor (também o usa busca.buscar); depois,
+    sorteio_real e historico_ate leem o histórico sem reenviá-lo a cada tarefa.
+    """
+    mascaras = np.asarray(mascaras, dtype=np.uint32)
+    acumulado = np.zeros((len(mascaras) + 1, sorteios.NUMEROS), dtype=np.int64)
+    np.cumsum(sorteios.mascaras_para_incidencia(mascaras), axis=0, out=acumulado[1:])
+    _CONTEXTO.update(mascaras=mascaras, acumulado=acumulado)
+
+
+def sorteio_real(concurso):
+    """Máscara do sorteio de índice `concurso` no processo de trabalho."""
+    return _CONTEXTO['mascaras'][concurso]
+
+
+def historico_ate(concurso):
+    """Entradas das estratégias usando apenas os sorteios anteriores ao índice `concurso`."""
+    import pandas as pd
+    contagem = _CONTEXTO['acumulado'][concurso]
+    numeros = np.flatnonzero(contagem) + 1
+    # Mesmo formato de calcular_frequencia_numeros: só números já sorteados, ordenados.
+    return {'frequencia': pd.Series(contagem[numeros - 1], index=numeros)}
+
+
+def _simular_trecho(tarefa):
+    """Simula um trecho de concursos e devolve, por estratégia, o histograma de acertos (ver POSICOES)."""
+    inicio, fim, semente, estrategias, bilhetes_por_concurso = tarefa
+    gerador = np.random.default_rng(semente)
+    resultado = {nome: np.zeros(POSICOES, dtype=np.int64) for nome in estrategias}
+    for concurso in range(inicio, fim):
+        historico = historico_ate(concurso)
+        for nome in estrategias:
+            bilhetes = ESTRATEGIAS[nome](historico, bilhetes_por_concurso, gerador)
+            acertos = sorteios.contar_bits(bilhetes & sorteio_real(concurso)).astype(np.int64)
+            acertos[sorteios.contar_bits(bilhetes) != sorteios.DEZENAS_POR_SORTEIO] = INCOMPLETOS
+            resultado[nome] += np.bincount(acertos, minlength=POSICOES)
+    return resultado
+
+
+def _tarefas(n_sorteios, inicio, semente, estrategias, bilhetes_por_concurso, concursos_por_tarefa):
+    """Divide os concursos em trechos de tamanho fixo, cada um com sua própria semente.
+
+    Como as sementes dependem só do trecho, o resultado não muda com o número de processos.
+    """
+    limites = list(range(inicio, n_sorteios, concursos_por_tarefa))
+    sementes = np.random.SeedSequence(semente).spawn(len(limites))
+    for limite, seq in zip(limites, sementes):
+        yield limite, min(limite + concursos_por_tarefa, n_sorteios), seq, estrategias, bilhetes_por_concurso
+
+
+def tabela_resultados(acertos):
+    """Monta a tabela agregada (uma linha por estratégia) a partir dos histogramas de acertos.
+
+    Bilhetes incompletos entram no total e na coluna 'incompletos', mas não pontuam.
+    """
+    import pandas as pd
+    linhas = []
+    for nome, histograma in acertos.items():
+        total = int(histograma.sum())
+        linha = {'estrategia': nome, 'bilhetes': total}
+        for faixa in FAIXAS_PREMIO:
+            linha[f'acertos_{faixa}'] = int(histograma[faixa])
+        linha['incompletos'] = int(histograma[INCOMPLETOS])
+        linha['taxa_premiados'] = histograma[FAIXAS_PREMIO[0]:INCOMPLETOS].sum() / total if total else 0.0
+        linha['media_acertos'] = histograma[:INCOMPLETOS] @ np.arange(INCOMPLETOS) / total if total else 0.0
+        linhas.append(linha)
+    return pd.DataFrame(linhas).set_index('estrategia')
+
+
+def executar_backtest(mascaras, bilhetes_por_concurso=10, inicio=100, estrategias=None, semente=0,
+                      processos=None, concursos_por_tarefa=50, ao_receber=None):
+    """Reproduz o histórico testando cada estratégia de jogo (API em lote gerar_lote_*) contra os sorteios reais.
+
+    Args:
+      mascaras: sorteios em ordem cronológica (ver sorteios.carregar_mascaras).
+      bilhetes_por_concurso: bilhetes gerados por estratégia em cada concurso.
+      inicio: índice do primeiro concurso simulado; os anteriores servem só de histórico.
+      estrategias: nomes de ESTRATEGIAS a testar (todas, por padrão).
+      semente: semente global; a mesma semente reproduz o mesmo resultado.
+      processos: tamanho do pool de processos (padrão: número de CPUs).
+      concursos_por_tarefa: concursos simulados por tarefa enviada ao pool.
+      ao_receber: função opcional chamada com a tabela parcial a cada trecho concluído.
+
+    Returns:
+      DataFrame com, por estratégia, bilhetes simulados, quantidade de 11 a 15 acertos e de
+      bilhetes incompletos.
+    """
+    mascaras = np.ascontiguousarray(mascaras, dtype=np.uint32)
+    estrategias = list(estrategias or ESTRATEGIAS)
+    desconhecidas = set(estrategias) - set(ESTRATEGIAS)
+    if desconhecidas:
+        raise ValueError(f"Estratégias desconhecidas: {sorted(desconhecidas)}")
+
+    acertos = {nome: np.zeros(POSICOES, dtype=np.int64) for nome in estrategias}
+    tarefas = _tarefas(len(mascaras), inicio, semente, estrategias, bilhetes_por_concurso, concursos_por_tarefa)
+    with ProcessPoolExecutor(max_workers=processos, initializer=inicializar_processo,
+                             initargs=(mascaras,)) as pool:
+        for parcial in pool.map(_simular_trecho, tarefas):
+            for nome, histograma in parcial.items():
+                acertos[nome] += histograma
+            if ao_receber is not None:
+                ao_receber(tabela_resultados(acertos))
+    return tabela_resultados(acertos)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest das estratégias de geração contra o histórico.")
+    parser.add_argument('caminho_arquivo', nargs='?', default=sorteios.CAMINHO_PADRAO, help="CSV de resultados")
+    parser.add_argument('--bilhetes', type=int, default=100, help="bilhetes por estratégia em cada concurso")
+    parser.add_argument('--estrategias', nargs='+', choices=sorted(ESTRATEGIAS))
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--processos', type=int)
+    args = parser.parse_args(argv)
+
+    try:
+        mascaras = sorteios.carregar_mascaras(args.caminho_arquivo)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo não encontrado em {args.caminho_arquivo}")
+        return
+
+    tabela = executar_backtest(mascaras, bilhetes_por_concurso=args.bilhetes, estrategias=args.estrategias,
+                               semente=args.semente, processos=args.processos)
+    print("Backtest das estratégias de geração:\n")
+    print(tabela.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import numpy as np
+from . import fechamento
+from . import jogo
+from . import padroes
+from . import perfil
+from . import sorteios
+
+TAMANHOS_PADRAO = [1_000, 100_000]
+CHAMADAS_GERADORES = 1_000
+_BLOCO = 1_000_000
+
+
+def gerar_historico_sintetico(quantidade, semente=0):
+    """Gera `quantidade` sorteios aleatórios (máscaras uint32), em blocos para caber na memória."""
+    gerador = np.random.default_rng(semente)
+    partes = []
+    for inicio in range(0, quantidade, _BLOCO):
+        tamanho = min(_BLOCO, quantidade - inicio)
+        escolhidos = gerador.random((tamanho, sorteios.NUMEROS)).argsort(axis=1) < sorteios.DEZENAS_POR_SORTEIO
+        partes.append(sorteios.matriz_para_mascaras(sorteios.incidencia_para_matriz(escolhidos)))
+    return np.concatenate(partes) if partes else np.zeros(0, dtype=np.uint32)
+
+
+def escrever_csv_sintetico(caminho, mascaras):
+    """Grava as máscaras no formato do CSV de resultados (Concurso, Data, Bola1..Bola15)."""
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(','.join(['Concurso', 'Data'] + [f'Bola{i}' for i in range(1, 16)]) + '\n')
+        for inicio in range(0, len(mascaras), _BLOCO):
+            matriz = sorteios.mascaras_para_matriz(mascaras[inicio:inicio + _BLOCO]).astype(np.int64)
+            concursos = np.arange(inicio + 1, inicio + len(matriz) + 1)
+            linhas = np.column_stack([concursos, np.zeros(len(matriz), dtype=np.int64), matriz])
+            np.savetxt(arquivo, linhas, fmt='%d', delimiter=',')
+
+
+def cronometrar(funcao, repeticoes):
+    """Menor tempo (segundos) entre `repeticoes` execuções da função."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _repetir(funcao, vezes=CHAMADAS_GERADORES):
+    """Chama a função `vezes` vezes (para medir geradores de uma aposta por chamada)."""
+    def executar():
+        for _ in range(vezes):
+            funcao()
+    return executar
+
+
+def casos(df, caminho_csv):
+    """Funções medidas para um histórico; os geradores são medidos em lotes de CHAMADAS_GERADORES chamadas."""
+    frequencia = jogo.calcular_frequencia_numeros(df)
+    pares_impares = jogo.calcular_pares_impares(df)
+    distribuicao = jogo.analisar_distribuicao_por_linha_coluna(df)
+    principal = list(range(1, 11))
+
+    def carregar_frio():
+        os.remove(sorteios.caminho_cache(caminho_csv))
+        jogo.carregar_dados(caminho_csv)
+
+    return {
+        'carregar_dados (sem cache)': carregar_frio,
+        'carregar_dados (com cache)': lambda: jogo.carregar_dados(caminho_csv),
+        'calcular_frequencia_numeros': lambda: jogo.calcular_frequencia_numeros(df),
+        'calcular_pares_impares': lambda: jogo.calcular_pares_impares(df),
+        'analisar_distribuicao_por_linha_coluna': lambda: jogo.analisar_distribuicao_por_linha_coluna(df),
+        'analisar_repeticoes': lambda: padroes.analisar_repeticoes(df),
+        'analisar_sequencias_repetidas': lambda: padroes.analisar_sequencias_repetidas(df),
+        'gerar_combinacao_mais_frequentes': _repetir(lambda: jogo.gerar_combinacao_mais_frequentes(frequencia)),
+        'gerar_combinacao_menos_frequentes': _repetir(lambda: jogo.gerar_combinacao_menos_frequentes(frequencia)),
+        'gerar_combinacao_mix_frequencias': _repetir(lambda: jogo.gerar_combinacao_mix_frequencias(frequencia)),
+        'gerar_combinacao_por_soma': _repetir(lambda: jogo.gerar_combinacao_por_soma(df, 180, 220)),
+        'gerar_combinacao_por_pares_impares': _repetir(
+            lambda: jogo.gerar_combinacao_por_pares_impares(pares_impares, mais_pares=True)),
+        'gerar_combinacao_por_distribuicao': _repetir(
+            lambda: jogo.gerar_combinacao_por_distribuicao(distribuicao, {0: 2, 2: 3}, [1, 4])),
+        'gerar_fechamento': _repetir(
+            lambda: fechamento.gerar_fechamento(principal, [11, 12, 13, 14, 15], [16, 17, 18, 19, 20],
+                                                [21, 22, 23, 24, 25])),
+    }
+
+
+def executar(tamanhos, repeticoes=3, semente=0, diretorio=None):
+    """Roda o benchmark para cada tamanho de histórico e devolve o resultado serializável."""
+    resultado = {
+        'metadados': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'processador': platform.processor(),
+            'semente': semente,
+            'repeticoes': repeticoes,
+            'chamadas_geradores': CHAMADAS_GERADORES,
+        },
+        'tempos': {},
+    }
+    perfil.zerar()
+    perfil.ativar()
+    with tempfile.TemporaryDirectory(dir=diretorio) as temporario:
+        for tamanho in tamanhos:
+            random.seed(semente)
+            caminho_csv = os.path.join(temporario, f'historico_{tamanho}.csv')
+            escrever_csv_sintetico(caminho_csv, gerar_historico_sintetico(tamanho, semente))
+            df = jogo.carregar_dados(caminho_csv)
+            tempos = {}
+            for nome, funcao in casos(df, caminho_csv).items():
+                tempos[nome] = cronometrar(funcao, repeticoes)
+                print(f"{tamanho:>10} {nome:<42} {tempos[nome]:.4f}s")
+            resultado['tempos'][str(tamanho)] = tempos
+    perfil.ativar(False)
+    resultado['perfil'] = perfil.relatorio()
+    return resultado
+
+
+def comparar(atual, anterior, tolerancia=0.2):
+    """Lista as medições que ficaram mais de `tolerancia` (fração) mais lentas que na execução anterior."""
+    regressoes = []
+    for tamanho, tempos in atual['tempos'].items():
+        for nome, segundos in tempos.items():
+            referencia = anterior.get('tempos', {}).get(tamanho, {}).get(nome)
+            if referencia and segundos > referencia * (1 + tolerancia):
+                regressoes.append((tamanho, nome, referencia, segundos))
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das análises e geradores da Lotofácil.")
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=TAMANHOS_PADRAO,
+                        help="quantidades de sorteios sintéticos (ex.: 1000 100000 10000000)")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', help="arquivo JSON para gravar o resultado")
+    parser.add_argument('--comparar', help="JSON de uma execução anterior para detectar regressões")
+    parser.add_argument('--tolerancia', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    resultado = executar(args.tamanhos, args.repeticoes, args.semente)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            anterior = json.load(arquivo)
+        regressoes = comparar(resultado, anterior, args.tolerancia)
+        for tamanho, nome, antes, depois in regressoes:
+            print(f"Regressão: {nome} ({tamanho} sorteios) {antes:.4f}s -> {depois:.4f}s")
+        if regressoes:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
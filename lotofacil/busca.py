@@ -0,0 +1,270 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, product
+import numpy as np
+from . import backtest
+from . import jogo
+from . import sorteios
+
+# Valor aproximado (R$) de cada faixa: 11 a 13 acertos têm valor fixo; 14 e 15 são rateados e
+# variam por concurso, então usam médias de referência. Substitua com `premios=` se preferir.
+PREMIOS = {11: 6.0, 12: 12.0, 13: 30.0, 14: 1_500.0, 15: 1_500_000.0}
+
+CRITERIOS = ('valor_esperado', 'media_acertos', 'taxa_premiados')
+
+# Cada família recebe o histórico, a quantidade de bilhetes, o gerador e seus parâmetros, e
+# devolve máscaras (mesmo formato de backtest.ESTRATEGIAS).
+FAMILIAS = {
+    'mais_frequentes': lambda h, n, g, tamanho_grupo: jogo.gerar_lote_mais_frequentes(
+        n, g, h['frequencia'], tamanho_grupo, formato='mascaras'),
+    'menos_frequentes': lambda h, n, g: jogo.gerar_lote_menos_frequentes(n, g, h['frequencia'], formato='mascaras'),
+    'mix_frequencias': lambda h, n, g, quantidade_mais, quantidade_menos: jogo.gerar_lote_mix_frequencias(
+        n, g, h['frequencia'], quantidade_mais, quantidade_menos, formato='mascaras'),
+    'por_soma': lambda h, n, g, faixa_soma_min, faixa_soma_max: jogo.gerar_lote_por_soma(
+        n, g, faixa_soma_min, faixa_soma_max, formato='mascaras'),
+    'por_pares_impares': lambda h, n, g, mais_pares: jogo.gerar_lote_por_pares_impares(
+        n, g, mais_pares=mais_pares, formato='mascaras'),
+    'por_distribuicao': lambda h, n, g, linhas_escolhidas, colunas_escolhidas: jogo.gerar_lote_por_distribuicao(
+        n, g, dict(linhas_escolhidas), list(colunas_escolhidas), formato='mascaras'),
+}
+
+
+def _linhas_possiveis():
+    """Escolhas de linhas: nenhuma, uma ou duas linhas (0 a 4), com 1 a 5 números em cada."""
+    escolhas = [()]
+    for quantidade_linhas in (1, 2):
+        for linhas in combinations(range(5), quantidade_linhas):
+            for quantidades in product(range(1, 6), repeat=quantidade_linhas):
+                escolhas.append(tuple(zip(linhas, quantidades)))
+    return escolhas
+
+
+# Valores de cada parâmetro por família; a grade é o produto cartesiano (filtrado por _valida).
+ESPACOS = {
+    'mais_frequentes': {'tamanho_grupo': list(range(15, 26))},
+    'menos_frequentes': {},
+    'mix_frequencias': {'quantidade_mais': list(range(0, 16)), 'quantidade_menos': list(range(0, 16))},
+    'por_soma': {'faixa_soma_min': list(range(150, 241, 2)), 'faixa_soma_max': list(range(160, 251, 2))},
+    'por_pares_impares': {'mais_pares': [True, False]},
+    'por_distribuicao': {
+        'linhas_escolhidas': _linhas_possiveis(),
+        'colunas_escolhidas': [cols for tamanho in range(1, 6) for cols in combinations(range(10), tamanho)],
+    },
+}
+
+
+def _valida(familia, parametros):
+    """Descarta combinações de parâmetros sem sentido (faixa vazia, grupo com menos de 15 números)."""
+    if familia == 'por_soma':
+        return parametros['faixa_soma_min'] <= parametros['faixa_soma_max']
+    if familia == 'mix_frequencias':
+        return parametros['quantidade_mais'] + parametros['quantidade_menos'] >= 15
+    return True
+
+
+def grade(familias=None, espacos=None):
+    """Todas as configurações válidas das famílias, como tuplas (família, ((parâmetro, valor), ...)).
+
+    Args:
+      familias: nomes de FAMILIAS (todas, por padrão).
+      espacos: substitui os valores de ESPACOS de algumas famílias ({família: {parâmetro: valores}}).
+    """
+    espacos = dict(ESPACOS, **(espacos or {}))
+    configuracoes = []
+    for familia in familias or FAMILIAS:
+        nomes = sorted(espacos[familia])
+        for valores in product(*(espacos[familia][nome] for nome in nomes)):
+            parametros = dict(zip(nomes, valores))
+            if _valida(familia, parametros):
+                configuracoes.append((familia, tuple(zip(nomes, valores))))
+    return configuracoes
+
+
+def amostrar(configuracoes, maximo, semente=0):
+    """Busca aleatória: até `maximo` configurações distintas sorteadas da lista (mantém a ordem).
+
+    A cota é dividida por família, para que as grades pequenas entrem inteiras em vez de sumirem
+    diante das grandes (por_distribuicao tem mais de 170 mil configurações).
+    """
+    if len(configuracoes) <= maximo:
+        return list(configuracoes)
+    gerador = np.random.default_rng(semente)
+    por_familia = {}
+    for indice, (familia, _) in enumerate(configuracoes):
+        por_familia.setdefault(familia, []).append(indice)
+    escolhidas = []
+    restantes = len(por_familia)
+    for indices in sorted(por_familia.values(), key=len):
+        cota = (maximo - len(escolhidas)) // restantes
+        escolhidas.extend(gerador.choice(indices, size=cota, replace=False) if len(indices) > cota else indices)
+        restantes -= 1
+    return [configuracoes[indice] for indice in sorted(escolhidas)]
+
+
+def descrever(configuracao):
+    """Texto curto de uma configuração, por exemplo 'por_soma(faixa_soma_max=220, faixa_soma_min=180)'."""
+    familia, parametros = configuracao
+    return f"{familia}({', '.join(f'{nome}={valor}' for nome, valor in parametros)})"
+
+
+def _avaliar_trecho(tarefa):
+    """Histogramas de acertos (configurações x 17) de um bloco de configurações em um trecho de concursos.
+
+    Usa o mesmo contexto de processo do backtest (backtest.inicializar_processo).
+    """
+    configuracoes, concursos, semente, bilhetes_por_concurso = tarefa
+    gerador = np.random.default_rng(semente)
+    estrategias = [(FAMILIAS[familia], dict(parametros)) for familia, parametros in configuracoes]
+    deslocamentos = np.arange(len(configuracoes)) * backtest.POSICOES
+    contagem = np.zeros(len(configuracoes) * backtest.POSICOES, dtype=np.int64)
+    for concurso in concursos:
+        historico = backtest.historico_ate(concurso)
+        bilhetes = np.concatenate([gerar(historico, bilhetes_por_concurso, gerador, **parametros)
+                                   for gerar, parametros in estrategias])
+        # Um popcount e um bincount para todas as configurações: cada uma ocupa 17 posições
+        acertos = sorteios.contar_bits(bilhetes & backtest.sorteio_real(concurso)).astype(np.int64)
+        acertos[sorteios.contar_bits(bilhetes) != sorteios.DEZENAS_POR_SORTEIO] = backtest.INCOMPLETOS
+        contagem += np.bincount(np.repeat(deslocamentos, bilhetes_por_concurso) + acertos,
+                                minlength=len(contagem))
+    return contagem.reshape(len(configuracoes), backtest.POSICOES)
+
+
+def pontuar(histogramas, criterio='valor_esperado', premios=PREMIOS):
+    """Pontuação de cada configuração a partir dos histogramas de acertos (maior é melhor).
+
+    Os histogramas seguem backtest.POSICOES: bilhetes incompletos contam no total e valem zero.
+    """
+    histogramas = np.asarray(histogramas, dtype=np.float64)
+    bilhetes = np.maximum(histogramas.sum(axis=1), 1)
+    if criterio == 'valor_esperado':
+        valores = np.zeros(backtest.POSICOES)
+        for faixa, valor in premios.items():
+            valores[faixa] = valor
+        return histogramas @ valores / bilhetes
+    if criterio == 'media_acertos':
+        return histogramas[:, :backtest.INCOMPLETOS] @ np.arange(backtest.INCOMPLETOS) / bilhetes
+    if criterio == 'taxa_premiados':
+        return histogramas[:, min(backtest.FAIXAS_PREMIO):backtest.INCOMPLETOS].sum(axis=1) / bilhetes
+    raise ValueError(f"Critério desconhecido: {criterio}")
+
+
+def relatorio(configuracoes, histogramas, concursos, criterio='valor_esperado', premios=PREMIOS):
+    """Tabela ordenada: primeiro as configurações que sobreviveram a mais rodadas, depois pela pontuação."""
+    import pandas as pd
+    linhas = []
+    for configuracao, histograma, avaliados in zip(configuracoes, histogramas, concursos):
+        bilhetes = int(histograma.sum())
+        linha = {'configuracao': descrever(configuracao), 'familia': configuracao[0], 'concursos': int(avaliados),
+                 'bilhetes': bilhetes}
+        for faixa in backtest.FAIXAS_PREMIO:
+            linha[f'acertos_{faixa}'] = int(histograma[faixa])
+        linha['incompletos'] = int(histograma[backtest.INCOMPLETOS])
+        for nome in CRITERIOS:
+            linha[nome] = float(pontuar(histograma[None], nome, premios)[0])
+        linhas.append(linha)
+    tabela = pd.DataFrame(linhas).sort_values(['concursos', criterio], ascending=False, kind='stable')
+    tabela.index = pd.RangeIndex(1, len(tabela) + 1, name='posicao')
+    return tabela
+
+
+def _blocos(sequencia, tamanho):
+    return [sequencia[inicio:inicio + tamanho] for inicio in range(0, len(sequencia), tamanho)]
+
+
+def buscar(mascaras, configuracoes, bilhetes_por_concurso=10, inicio=100, concursos_iniciais=30, eta=3,
+           finalistas=10, criterio='valor_esperado', premios=PREMIOS, semente=0, processos=None,
+           configuracoes_por_tarefa=64, concursos_por_tarefa=50, ao_concluir_rodada=None):
+    """Avalia configurações de estratégia contra o histórico com eliminação sucessiva (successive halving).
+
+    Os concursos a partir de `inicio` são embaralhados uma vez; na primeira rodada todas as
+    configurações jogam os `concursos_iniciais` primeiros dessa ordem, só a melhor fração 1/eta
+    segue, e cada rodada seguinte multiplica por `eta` os concursos avaliados (somando aos já
+    jogados). Quando restam `finalistas` ou menos, eles jogam todos os concursos restantes.
+
+    Args:
+      mascaras: sorteios em ordem cronológica (ver sorteios.carregar_mascaras).
+      configuracoes: lista de grade() ou amostrar().
+      criterio: um de CRITERIOS, usado na eliminação e na ordem do relatório.
+      premios: valor de cada faixa de acertos para o critério 'valor_esperado'.
+      semente: semente global; a mesma semente e as mesmas configurações reproduzem o resultado.
+      processos: tamanho do pool de processos (padrão: número de CPUs).
+      ao_concluir_rodada: função opcional chamada com (rodada, sobreviventes, concursos avaliados).
+
+    Returns:
+      DataFrame do relatório (ver relatorio).
+    """
+    mascaras = np.ascontiguousarray(mascaras, dtype=np.uint32)
+    configuracoes = list(configuracoes)
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Critério desconhecido: {criterio}")
+    desconhecidas = {familia for familia, _ in configuracoes} - set(FAMILIAS)
+    if desconhecidas:
+        raise ValueError(f"Famílias desconhecidas: {sorted(desconhecidas)}")
+
+    ordem = np.random.default_rng(np.random.SeedSequence(semente)).permutation(np.arange(inicio, len(mascaras)))
+    histogramas = np.zeros((len(configuracoes), backtest.POSICOES), dtype=np.int64)
+    avaliados = np.zeros(len(configuracoes), dtype=np.int64)
+    vivas = np.arange(len(configuracoes))
+    feitos, alvo, rodada = 0, concursos_iniciais, 0
+    with ProcessPoolExecutor(max_workers=processos, initializer=backtest.inicializar_processo,
+                             initargs=(mascaras,)) as pool:
+        while len(vivas) and feitos < len(ordem):
+            alvo = len(ordem) if len(vivas) <= finalistas else min(alvo, len(ordem))
+            blocos = [(indices, concursos) for indices in _blocos(vivas, configuracoes_por_tarefa)
+                      for concursos in _blocos(ordem[feitos:alvo], concursos_por_tarefa)]
+            sementes = np.random.SeedSequence([semente, rodada]).spawn(len(blocos))
+            tarefas = [([configuracoes[i] for i in indices], concursos, seq, bilhetes_por_concurso)
+                       for (indices, concursos), seq in zip(blocos, sementes)]
+            for (indices, _), parcial in zip(blocos, pool.map(_avaliar_trecho, tarefas)):
+                histogramas[indices] += parcial
+            avaliados[vivas] = alvo
+            if ao_concluir_rodada is not None:
+                ao_concluir_rodada(rodada, len(vivas), alvo)
+
+            # Só a melhor fração segue; desempate estável pela ordem original
+            pontos = pontuar(histogramas[vivas], criterio, premios)
+            manter = max(finalistas, -(-len(vivas) // eta))
+            vivas = np.sort(vivas[np.argsort(-pontos, kind='stable')[:manter]])
+            feitos, alvo, rodada = alvo, alvo * eta, rodada + 1
+    return relatorio(configuracoes, histogramas, avaliados, criterio, premios)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Busca parâmetros das estratégias de geração pelo backtest.")
+    parser.add_argument('caminho_arquivo', nargs='?', default=sorteios.CAMINHO_PADRAO, help="CSV de resultados")
+    parser.add_argument('--familias', nargs='+', choices=sorted(FAMILIAS))
+    parser.add_argument('--maximo', type=int, default=20_000,
+                        help="configurações avaliadas; grades maiores viram busca aleatória")
+    parser.add_argument('--bilhetes', type=int, default=10, help="bilhetes por configuração em cada concurso")
+    parser.add_argument('--concursos-iniciais', type=int, default=30)
+    parser.add_argument('--eta', type=int, default=3, help="fator de eliminação a cada rodada")
+    parser.add_argument('--finalistas', type=int, default=10)
+    parser.add_argument('--criterio', choices=CRITERIOS, default='valor_esperado')
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--processos', type=int)
+    parser.add_argument('--top', type=int, default=20, help="linhas do relatório exibidas")
+    parser.add_argument('--saida', help="grava o relatório completo neste CSV")
+    args = parser.parse_args(argv)
+
+    try:
+        mascaras = sorteios.carregar_mascaras(args.caminho_arquivo)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo não encontrado em {args.caminho_arquivo}")
+        return
+
+    todas = grade(args.familias)
+    configuracoes = amostrar(todas, args.maximo, args.semente)
+    print(f"Avaliando {len(configuracoes)} de {len(todas)} configurações.")
+    tabela = buscar(mascaras, configuracoes, bilhetes_por_concurso=args.bilhetes,
+                    concursos_iniciais=args.concursos_iniciais, eta=args.eta, finalistas=args.finalistas,
+                    criterio=args.criterio, semente=args.semente, processos=args.processos,
+                    ao_concluir_rodada=lambda rodada, vivas, concursos: print(
+                        f"Rodada {rodada}: {vivas} configurações em {concursos} concursos"))
+    if args.saida:
+        tabela.to_csv(args.saida)
+    print()
+    print(tabela.drop(columns='familia').head(args.top).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from . import perfil
+from . import sorteios
+
+
+class ConferenciaHistorica:
+    """Confere apostas contra todos os sorteios do histórico.
+
+    Os sorteios ficam como máscaras de 25 bits: os acertos de uma aposta em um concurso são o
+    popcount do AND das duas máscaras, calculado em blocos vetorizados. Uma cópia ordenada
+    das máscaras responde por busca binária se uma combinação exata já foi sorteada.
+    """
+
+    def __init__(self, mascaras, bloco=1 << 22):
+        self.mascaras = np.ascontiguousarray(mascaras, dtype=np.uint32)
+        self._ordem = np.argsort(self.mascaras, kind='stable')
+        self._ordenadas = self.mascaras[self._ordem]
+        self._bloco = bloco
+
+    def __len__(self):
+        return len(self.mascaras)
+
+    def acertos(self, aposta):
+        """Acertos de uma aposta em cada concurso do histórico (array uint8)."""
+        mascara = sorteios.para_mascaras(aposta)[0]
+        return sorteios.contar_bits(self.mascaras & mascara).astype(np.uint8)
+
+    @perfil.cronometrado
+    def distribuicao(self, apostas, minimo=0, threads=None):
+        """Histograma de acertos de cada aposta no histórico.
+
+        Os blocos de apostas são conferidos em threads: as operações do NumPy usadas liberam o GIL.
+
+        Args:
+          apostas: uma aposta, lista de apostas, matriz (apostas x 15) ou array de máscaras.
+          minimo: menor quantidade de acertos contada; cada faixa a menos é uma passada a menos.
+          threads: quantidade de threads (padrão: número de CPUs).
+
+        Returns:
+          Array int64 (apostas x (16 - minimo)): a coluna j conta os concursos em que a aposta
+          acertou minimo + j números.
+        """
+        apostas = sorteios.para_mascaras(apostas)
+        resultado = np.zeros((len(apostas), 16 - minimo), dtype=np.int64)
+        passo = max(1, self._bloco // max(1, len(self.mascaras)))
+
+        def conferir(inicio):
+            acertos = sorteios.contar_bits(apostas[inicio:inicio + passo, None] & self.mascaras)
+            for coluna, k in enumerate(range(minimo, 16)):
+                resultado[inicio:inicio + passo, coluna] = np.count_nonzero(acertos == k, axis=1)
+
+        with ThreadPoolExecutor(max_workers=threads or os.cpu_count()) as pool:
+            list(pool.map(conferir, range(0, len(apostas), passo)))
+        return resultado
+
+    def premiacoes(self, apostas, threads=None):
+        """Quantas vezes cada aposta teria feito 11, 12, 13, 14 e 15 pontos (array apostas x 5)."""
+        return self.distribuicao(apostas, minimo=11, threads=threads)
+
+    def ja_sorteada(self, apostas):
+        """Indica, para cada aposta, se exatamente a mesma combinação já foi sorteada."""
+        apostas = sorteios.para_mascaras(apostas)
+        if len(self._ordenadas) == 0:
+            return np.zeros(len(apostas), dtype=bool)
+        posicoes = np.minimum(np.searchsorted(self._ordenadas, apostas), len(self._ordenadas) - 1)
+        return self._ordenadas[posicoes] == apostas
+
+    def concursos_iguais(self, aposta):
+        """Índices dos concursos (em ordem) em que a combinação exata foi sorteada."""
+        mascara = sorteios.para_mascaras(aposta)[0]
+        inicio, fim = np.searchsorted(self._ordenadas, [mascara, mascara + 1])
+        return np.sort(self._ordem[inicio:fim])
@@ -0,0 +1,107 @@
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+import numpy as np
+from . import sorteios
+
+TAMANHOS_TUPLAS = (3, 4)
+
+# _BINOMIAIS[n, k] = C(n, k), usado para numerar as combinações (sistema combinatório).
+_BINOMIAIS = np.array([[comb(n, k) for k in range(5)] for n in range(sorteios.NUMEROS + 1)], dtype=np.int64)
+
+
+@lru_cache(maxsize=None)
+def _tuplas_por_posicao(tamanho):
+    """Índices das combinações de `tamanho` posições entre as 15 dezenas de um sorteio."""
+    return np.array(list(combinations(range(sorteios.DEZENAS_POR_SORTEIO), tamanho)), dtype=np.intp)
+
+
+def _posto(numeros):
+    """Posto (0 a C(25,k)-1) de cada tupla ordenada de números 0-based (última dimensão = k)."""
+    posto = np.zeros(numeros.shape[:-1], dtype=np.int64)
+    for i in range(numeros.shape[-1]):
+        posto += _BINOMIAIS[numeros[..., i], i + 1]
+    return posto
+
+
+@lru_cache(maxsize=None)
+def _tuplas_por_posto(tamanho):
+    """Tabela posto -> tupla de números (1 a 25)."""
+    tuplas = np.array(list(combinations(range(sorteios.NUMEROS), tamanho)), dtype=np.int64)
+    tabela = np.empty_like(tuplas)
+    tabela[_posto(tuplas)] = tuplas + 1
+    return tabela
+
+
+class Coocorrencia:
+    """Contagens de pares, triplas e quadras de números que saíram juntos no mesmo sorteio.
+
+    A matriz 25 x 25 de pares é o produto I^T I da matriz de incidência (a diagonal é a
+    frequência de cada número). Triplas e quadras ficam em vetores indexados pelo posto da
+    combinação (2.300 e 12.650 posições), contados com bincount sobre as C(15,k) tuplas de
+    cada sorteio, em blocos de sorteios. Incluir um sorteio só soma as contribuições dele.
+    """
+
+    def __init__(self, mascaras=None):
+        self.pares = np.zeros((sorteios.NUMEROS, sorteios.NUMEROS), dtype=np.int64)
+        self.tuplas = {tamanho: np.zeros(comb(sorteios.NUMEROS, tamanho), dtype=np.int64)
+                       for tamanho in TAMANHOS_TUPLAS}
+        self.quantidade = 0
+        if mascaras is not None:
+            self.adicionar_lote(mascaras)
+
+    def adicionar(self, numeros):
+        """Inclui um sorteio (lista de números)."""
+        self.adicionar_lote(np.array([sorteios.codificar_sorteio(numeros)], dtype=np.uint32))
+
+    def adicionar_lote(self, mascaras, bloco=1024):
+        """Inclui vários sorteios (máscaras); sorteios incompletos são ignorados.
+
+        Os sorteios são processados `bloco` por vez: a memória temporária (as C(15,4) quadras
+        de cada sorteio do bloco) não depende do tamanho do lote.
+        """
+        mascaras = np.asarray(mascaras, dtype=np.uint32)
+        mascaras = mascaras[sorteios.contar_bits(mascaras) == sorteios.DEZENAS_POR_SORTEIO]
+        for inicio in range(0, len(mascaras), bloco):
+            trecho = mascaras[inicio:inicio + bloco]
+            incidencia = sorteios.mascaras_para_incidencia(trecho).astype(np.int64)
+            self.pares += incidencia.T @ incidencia
+            numeros = sorteios.mascaras_para_matriz(trecho).astype(np.intp) - 1
+            # Parcelas do posto por posição: C(numero, i + 1) de cada dezena, para cada i
+            parcelas = _BINOMIAIS[numeros, 1:].transpose(2, 0, 1)
+            for tamanho, contagem in self.tuplas.items():
+                posicoes = _tuplas_por_posicao(tamanho)
+                postos = parcelas[0][:, posicoes[:, 0]]
+                for i in range(1, tamanho):
+                    postos += parcelas[i][:, posicoes[:, i]]
+                contagem += np.bincount(postos.ravel(), minlength=len(contagem))
+        self.quantidade += len(mascaras)
+
+    def contagem(self, tupla):
+        """Quantas vezes todos os números da tupla (2 a 4 números) saíram juntos."""
+        numeros = sorted(tupla)
+        if len(numeros) == 2:
+            return int(self.pares[numeros[0] - 1, numeros[1] - 1])
+        posto = _posto(np.array(numeros, dtype=np.intp) - 1)
+        return int(self.tuplas[len(numeros)][posto])
+
+    def mais_frequentes(self, tamanho=2, k=10, crescente=False):
+        """As k tuplas de `tamanho` números que mais (ou menos) saíram juntas, como [(tupla, contagem)]."""
+        if tamanho == 2:
+            linhas, colunas = np.triu_indices(sorteios.NUMEROS, 1)
+            contagens = self.pares[linhas, colunas]
+            tuplas = np.column_stack([linhas, colunas]) + 1
+        else:
+            contagens = self.tuplas[tamanho]
+            tuplas = _tuplas_por_posto(tamanho)
+        k = min(k, len(contagens))
+        chave = contagens if crescente else -contagens
+        escolhidas = np.argpartition(chave, k - 1)[:k]
+        escolhidas = escolhidas[np.argsort(chave[escolhidas], kind='stable')]
+        return [(tuple(int(n) for n in tuplas[i]), int(contagens[i])) for i in escolhidas]
+
+    def pesos_pares(self):
+        """Matriz float de afinidade entre números (contagem de pares, diagonal zerada)."""
+        pesos = self.pares.astype(np.float64)
+        np.fill_diagonal(pesos, 0.0)
+        return pesos
@@ -0,0 +1,147 @@
+import os
+from functools import lru_cache
+import numpy as np
+from . import sorteios
+
+DIRETORIO_PADRAO = os.path.join(os.path.expanduser('~'), '.cache', 'lotofacil', 'espaco_v1')
+COLUNAS_INDICE = ('mascaras', 'soma', 'pares', 'linhas', 'colunas')
+
+_BLOCO = 1 << 20
+
+
+def _caracteristicas(mascaras):
+    """Calcula soma, quantidade de pares e histogramas de linha/coluna de um bloco de máscaras."""
+    incidencia = sorteios.mascaras_para_incidencia(mascaras)
+    numeros = np.arange(1, sorteios.NUMEROS + 1, dtype=np.uint16)
+    linhas, colunas = sorteios.linhas_colunas(incidencia)
+    return {
+        'soma': (incidencia * numeros).sum(axis=1, dtype=np.uint16),
+        'pares': incidencia[:, 1::2].sum(axis=1, dtype=np.uint8),
+        'linhas': linhas,
+        'colunas': colunas,
+    }
+
+
+def construir_indice(diretorio=DIRETORIO_PADRAO):
+    """Enumera as C(25,15) combinações e grava máscaras e características como arquivos .npy."""
+    os.makedirs(diretorio, exist_ok=True)
+    mascaras = sorteios.combinacoes_mascaras(sorteios.NUMEROS, sorteios.DEZENAS_POR_SORTEIO)
+    total = len(mascaras)
+    colunas = {
+        'mascaras': mascaras,
+        'soma': np.empty(total, dtype=np.uint16),
+        'pares': np.empty(total, dtype=np.uint8),
+        'linhas': np.empty((total, 5), dtype=np.uint8),
+        'colunas': np.empty((total, 10), dtype=np.uint8),
+    }
+    for inicio in range(0, total, _BLOCO):
+        for nome, valores in _caracteristicas(mascaras[inicio:inicio + _BLOCO]).items():
+            colunas[nome][inicio:inicio + _BLOCO] = valores
+    for nome, valores in colunas.items():
+        temporario = os.path.join(diretorio, f'{nome}.{os.getpid()}.tmp.npy')
+        np.save(temporario, valores)
+        os.replace(temporario, os.path.join(diretorio, f'{nome}.npy'))
+
+
+@lru_cache(maxsize=None)
+def carregar_indice(diretorio=DIRETORIO_PADRAO):
+    """Mapeia em memória o índice do espaço de combinações, construindo-o na primeira vez.
+
+    Returns:
+      Dicionário {'mascaras', 'soma', 'pares', 'linhas', 'colunas'} de arrays somente leitura,
+      todos alinhados pela mesma posição (3.268.760 linhas).
+    """
+    caminhos = {nome: os.path.join(diretorio, f'{nome}.npy') for nome in COLUNAS_INDICE}
+    if not all(os.path.exists(caminho) for caminho in caminhos.values()):
+        construir_indice(diretorio)
+    return {nome: np.load(caminho, mmap_mode='r') for nome, caminho in caminhos.items()}
+
+
+def pontuacao_frequencia(frequencia, indice=None):
+    """Soma das frequências históricas dos 15 números de cada combinação do índice.
+
+    Args:
+      frequencia: Series de calcular_frequencia_numeros (índice = número) ou vetor de 25 pesos.
+    """
+    indice = indice or carregar_indice()
+    pesos = np.append(_pesos_por_numero(frequencia), np.zeros(7))
+    # Tabela por byte da máscara: soma dos pesos dos bits ligados em cada um dos 256 valores.
+    bits_byte = (np.arange(256)[:, None] >> np.arange(8)) & 1
+    tabelas = [bits_byte @ pesos[8 * byte:8 * byte + 8] for byte in range(4)]
+    mascaras = indice['mascaras']
+    pontuacao = np.zeros(len(mascaras), dtype=np.float64)
+    for byte, tabela in enumerate(tabelas):
+        pontuacao += tabela[(mascaras >> np.uint32(8 * byte)) & np.uint32(0xFF)]
+    return pontuacao
+
+
+def _pesos_por_numero(frequencia):
+    """Converte a frequência (Series indexada por número ou vetor) em um vetor float de 25 posições."""
+    if hasattr(frequencia, 'index'):
+        pesos = np.zeros(sorteios.NUMEROS, dtype=np.float64)
+        for num, valor in frequencia.items():
+            if 1 <= num <= sorteios.NUMEROS:
+                pesos[int(num) - 1] = valor
+        return pesos
+    pesos = np.asarray(frequencia, dtype=np.float64)
+    if pesos.shape != (sorteios.NUMEROS,):
+        raise ValueError("A frequência deve ter um valor para cada número de 1 a 25")
+    return pesos
+
+
+def _na_faixa(valores, faixa):
+    """Compara com um valor exato (int) ou com uma faixa inclusiva (min, max)."""
+    if isinstance(faixa, tuple):
+        return (valores >= faixa[0]) & (valores <= faixa[1])
+    return valores == faixa
+
+
+def filtrar(soma=None, pares=None, linhas=None, colunas=None, pontuacao=None, faixa_pontuacao=None,
+            fixos=None, excluidos=None, indice=None):
+    """Máscara booleana das combinações do índice que satisfazem todas as restrições.
+
+    Args:
+      soma, pares: valor exato ou faixa inclusiva (min, max).
+      linhas, colunas: dicionários {linha/coluna: valor ou faixa} sobre os histogramas do volante.
+      pontuacao, faixa_pontuacao: array de pontuacao_frequencia e a faixa (min, max) aceita.
+      fixos: números que devem estar em todas as combinações.
+      excluidos: números que não podem aparecer.
+    """
+    indice = indice or carregar_indice()
+    selecao = np.ones(len(indice['mascaras']), dtype=bool)
+    if soma is not None:
+        selecao &= _na_faixa(indice['soma'], soma)
+    if pares is not None:
+        selecao &= _na_faixa(indice['pares'], pares)
+    for nome, restricoes in (('linhas', linhas), ('colunas', colunas)):
+        for posicao, faixa in (restricoes or {}).items():
+            selecao &= _na_faixa(indice[nome][:, posicao], faixa)
+    if faixa_pontuacao is not None:
+        if pontuacao is None:
+            raise ValueError("faixa_pontuacao exige o array de pontuacao_frequencia")
+        selecao &= _na_faixa(pontuacao, faixa_pontuacao)
+    if fixos:
+        obrigatorios = np.uint32(sorteios.codificar_sorteio(fixos))
+        selecao &= (indice['mascaras'] & obrigatorios) == obrigatorios
+    if excluidos:
+        selecao &= (indice['mascaras'] & np.uint32(sorteios.codificar_sorteio(excluidos))) == 0
+    return selecao
+
+
+def contar(**restricoes):
+    """Quantas combinações satisfazem as restrições (mesmos argumentos de filtrar)."""
+    return int(np.count_nonzero(filtrar(**restricoes)))
+
+
+def sortear(quantidade, gerador, repetir=True, **restricoes):
+    """Sorteia uniformemente combinações que satisfazem as restrições.
+
+    Returns:
+      Array uint32 de máscaras; use sorteios.mascaras_para_matriz para obter as dezenas.
+    """
+    indice = restricoes.get('indice') or carregar_indice()
+    posicoes = np.flatnonzero(filtrar(**restricoes))
+    if len(posicoes) == 0:
+        raise ValueError("Nenhuma combinação satisfaz as restrições")
+    escolhidas = gerador.choice(posicoes, size=quantidade, replace=repetir)
+    return np.asarray(indice['mascaras'][escolhidas])
@@ -0,0 +1,108 @@
+import numpy as np
+from . import sorteios
+
+_NUMEROS = np.arange(1, sorteios.NUMEROS + 1, dtype=np.int64)
+
+
+def serie_frequencia(contagem):
+    """Converte 25 contagens (posição 0 = número 1) na Series de jogo.calcular_frequencia_numeros."""
+    import pandas as pd
+
+    contagem = np.asarray(contagem)
+    numeros = np.flatnonzero(contagem) + 1
+    return pd.Series(contagem[numeros - 1], index=numeros, name='count')
+
+
+class EstatisticasMoveis:
+    """Estatísticas acumuladas e por janela móvel (frequência, soma, pares/ímpares, linhas/colunas).
+
+    Guarda a soma acumulada da incidência de cada número; a frequência em qualquer janela
+    dos últimos w sorteios é a diferença de duas linhas desse acumulado. Incluir um sorteio
+    custa O(25) e consultar qualquer janela também, sem recalcular o histórico. As demais
+    estatísticas da janela saem da frequência (soma = frequência x números, etc.).
+    """
+
+    def __init__(self, mascaras=None, capacidade=1024):
+        self._mascaras = np.zeros(capacidade, dtype=np.uint32)
+        self._acumulado = np.zeros((capacidade + 1, sorteios.NUMEROS), dtype=np.int64)
+        self._n = 0
+        if mascaras is not None:
+            self.adicionar_lote(mascaras)
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def mascaras(self):
+        """Máscaras dos sorteios incluídos, em ordem."""
+        return self._mascaras[:self._n]
+
+    def _reservar(self, quantidade):
+        """Garante espaço para mais `quantidade` sorteios (crescimento geométrico)."""
+        necessario = self._n + quantidade
+        if necessario <= len(self._mascaras):
+            return
+        capacidade = max(necessario, 2 * len(self._mascaras))
+        mascaras = np.zeros(capacidade, dtype=np.uint32)
+        mascaras[:self._n] = self.mascaras
+        acumulado = np.zeros((capacidade + 1, sorteios.NUMEROS), dtype=np.int64)
+        acumulado[:self._n + 1] = self._acumulado[:self._n + 1]
+        self._mascaras, self._acumulado = mascaras, acumulado
+
+    def adicionar(self, numeros):
+        """Inclui um sorteio (lista de números)."""
+        self.adicionar_lote(np.array([sorteios.codificar_sorteio(numeros)], dtype=np.uint32))
+
+    def adicionar_lote(self, mascaras):
+        """Inclui vários sorteios de uma vez, a partir das máscaras (ver sorteios.carregar_mascaras)."""
+        mascaras = np.asarray(mascaras, dtype=np.uint32)
+        quantidade = len(mascaras)
+        if quantidade == 0:
+            return
+        self._reservar(quantidade)
+        inicio, fim = self._n, self._n + quantidade
+        self._mascaras[inicio:fim] = mascaras
+        incidencia = sorteios.mascaras_para_incidencia(mascaras)
+        np.cumsum(incidencia, axis=0, out=self._acumulado[inicio + 1:fim + 1])
+        self._acumulado[inicio + 1:fim + 1] += self._acumulado[inicio]
+        self._n = fim
+
+    def _inicio(self, janela):
+        """Índice do primeiro sorteio da janela (None = histórico todo)."""
+        if janela is None:
+            return 0
+        if janela < 1:
+            raise ValueError(f"Janela inválida: {janela}")
+        return max(0, self._n - janela)
+
+    def frequencia(self, janela=None):
+        """Quantas vezes cada número (posição 0 = número 1) saiu nos últimos `janela` sorteios."""
+        return self._acumulado[self._n] - self._acumulado[self._inicio(janela)]
+
+    def frequencias(self, janelas):
+        """Frequências de várias janelas de uma vez; array (len(janelas) x 25)."""
+        inicios = [self._inicio(janela) for janela in janelas]
+        return self._acumulado[self._n] - self._acumulado[inicios]
+
+    def serie_frequencia(self, janela=None):
+        """Frequência no formato de jogo.calcular_frequencia_numeros (Series dos números já sorteados)."""
+        return serie_frequencia(self.frequencia(janela))
+
+    def soma(self, janela=None):
+        """Soma de todos os números sorteados na janela."""
+        return int(self.frequencia(janela) @ _NUMEROS)
+
+    def media_soma(self, janela=None):
+        """Soma média por sorteio na janela."""
+        quantidade = self._n - self._inicio(janela)
+        return self.soma(janela) / quantidade if quantidade else 0.0
+
+    def pares_impares(self, janela=None):
+        """Total de números pares e ímpares sorteados na janela."""
+        frequencia = self.frequencia(janela)
+        return int(frequencia[1::2].sum()), int(frequencia[0::2].sum())
+
+    def linhas_colunas(self, janela=None):
+        """Totais por linha (5) e coluna (10) do volante na janela."""
+        linhas, colunas = sorteios.linhas_colunas(self.frequencia(janela)[None, :])
+        return linhas[0], colunas[0]
@@ -0,0 +1,284 @@
+import argparse
+import random
+from itertools import combinations
+from . import perfil
+
+# numpy e sorteios são importados dentro das funções de fechamento garantido: gerar_fechamento
+# só usa inteiros e não deve pagar a importação do numpy.
+
+
+@perfil.cronometrado
+def gerar_fechamento(grupo_principal, grupo_a, grupo_b, grupo_c):
+    """Gera um fechamento combinatório para Lotofácil.
+
+    Os grupos podem ser listas de números ou tipos.Combinacao.
+    """
+    grupo_principal, grupo_a, grupo_b, grupo_c = map(list, (grupo_principal, grupo_a, grupo_b, grupo_c))
+
+    combinacoes = []
+    # Aposta 1
+    combinacao1 = grupo_principal + random.sample(grupo_a, 5)
+    combinacoes.append(sorted(combinacao1))
+
+    # Aposta 2
+    combinacao2 = grupo_principal + random.sample(grupo_b, 5)
+    combinacoes.append(sorted(combinacao2))
+
+    # Aposta 3
+    combinacao3 = grupo_principal + random.sample(grupo_c, 5)
+    combinacoes.append(sorted(combinacao3))
+
+    # Aposta 4
+    combinacao4 = grupo_principal + random.sample(grupo_a+grupo_b+grupo_c,5)
+    combinacoes.append(sorted(combinacao4))
+
+    return combinacoes
+
+# Entradas (pares candidata-vizinho) a partir das quais o fechamento garantido é recusado,
+# e bytes até os quais a tabela de vizinhos é pré-calculada em vez de recalculada sob demanda.
+LIMITE_VIZINHOS = 1_000_000_000
+LIMITE_TABELA = 1 << 28
+
+
+def _largura(n_dezenas, distancia):
+    """Quantos vizinhos (incluindo a própria) cada combinação de 15 entre `n_dezenas` tem a até `distancia` trocas."""
+    from math import comb
+    fora = n_dezenas - 15
+    return sum(comb(15, trocas) * comb(fora, trocas) for trocas in range(min(distancia, fora) + 1))
+
+
+class _Vizinhanca:
+    """Índices (int32) das combinações a até `distancia` trocas de cada combinação candidata.
+
+    Uma aposta garante t acertos para um sorteio exatamente quando os dois diferem em no máximo
+    15 - t números, então esses vizinhos (incluindo a própria) são os sorteios que ela cobre.
+    Os vizinhos são gerados em blocos de cerca de `bloco` entradas: a tabela inteira só é
+    guardada se couber em LIMITE_TABELA; acima disso, cada bloco é recalculado quando pedido.
+    """
+
+    def __init__(self, candidatas, n_dezenas, distancia, bloco=1 << 22):
+        import numpy as np
+        self.candidatas = candidatas
+        self.n_dezenas = n_dezenas
+        self.largura = _largura(n_dezenas, distancia)
+        self.passo = max(1, bloco // self.largura)
+        fora = n_dezenas - 15
+        self._trocas = [(np.array(list(combinations(range(15), trocas))),
+                         np.array(list(combinations(range(fora), trocas))))
+                        for trocas in range(1, min(distancia, fora) + 1)]
+        self.tabela = None
+        if len(candidatas) * self.largura * 4 <= LIMITE_TABELA:
+            self.tabela = np.concatenate(list(self.blocos(np.arange(len(candidatas)))))
+
+    def __len__(self):
+        return len(self.candidatas)
+
+    def _calcular(self, linhas):
+        import numpy as np
+        from . import sorteios
+        selecionadas = self.candidatas[linhas]
+        incidencia = sorteios.mascaras_para_incidencia(selecionadas)[:, :self.n_dezenas]
+        bits = np.uint32(1) << np.arange(self.n_dezenas, dtype=np.uint32)
+        bits_dentro = bits[np.nonzero(incidencia)[1].reshape(len(linhas), 15)]
+        bits_fora = bits[np.nonzero(~incidencia)[1].reshape(len(linhas), self.n_dezenas - 15)]
+
+        vizinhos = np.empty((len(linhas), self.largura), dtype=np.int32)
+        vizinhos[:, 0] = linhas
+        coluna = 1
+        for saem, entram in self._trocas:
+            saem = np.bitwise_or.reduce(bits_dentro[:, saem], axis=2)
+            entram = np.bitwise_or.reduce(bits_fora[:, entram], axis=2)
+            mascaras = selecionadas[:, None, None] ^ saem[:, :, None] ^ entram[:, None, :]
+            largura = saem.shape[1] * entram.shape[1]
+            vizinhos[:, coluna:coluna + largura] = np.searchsorted(self.candidatas, mascaras.reshape(len(linhas), -1))
+            coluna += largura
+        return vizinhos
+
+    def blocos(self, linhas):
+        """Matrizes de vizinhos das `linhas` (índices das candidatas), em blocos de até `passo` linhas."""
+        for inicio in range(0, len(linhas), self.passo):
+            trecho = linhas[inicio:inicio + self.passo]
+            yield self.tabela[trecho] if self.tabela is not None else self._calcular(trecho)
+
+    def de(self, linha):
+        """Vizinhos de uma única candidata."""
+        import numpy as np
+        return next(self.blocos(np.array([linha])))[0]
+
+
+def _cobertura_gulosa(vizinhanca, rng):
+    """Escolhe apostas gulosamente (a que cobre mais sorteios ainda descobertos), desempates aleatórios."""
+    import numpy as np
+    total = len(vizinhanca)
+    ordem = rng.permutation(total)
+    ganho = np.full(total, vizinhanca.largura, dtype=np.int64)[ordem]
+    posicao = np.empty(total, dtype=np.int64)
+    posicao[ordem] = np.arange(total)
+    coberto = np.zeros(total, dtype=bool)
+    escolhidas = []
+    while not coberto.all():
+        melhor = ordem[int(np.argmax(ganho))]
+        escolhidas.append(melhor)
+        perfil.contar('fechamento.iteracoes_gulosas')
+        vizinhos = vizinhanca.de(melhor)
+        novos = vizinhos[~coberto[vizinhos]]
+        coberto[novos] = True
+        for trecho in vizinhanca.blocos(novos):
+            np.subtract.at(ganho, posicao[trecho.ravel()], 1)
+    return escolhidas
+
+
+def _remover_redundantes(escolhidas, vizinhanca, rng):
+    """Busca local: descarta apostas cujos sorteios cobertos já são cobertos por outras."""
+    import numpy as np
+    cobertura = np.zeros(len(vizinhanca), dtype=np.int64)
+    for trecho in vizinhanca.blocos(np.asarray(escolhidas)):
+        cobertura += np.bincount(trecho.ravel(), minlength=len(vizinhanca))
+    mantidas = []
+    for aposta in rng.permutation(escolhidas):
+        vizinhos = vizinhanca.de(aposta)
+        if (cobertura[vizinhos] >= 2).all():
+            cobertura[vizinhos] -= 1
+            perfil.contar('fechamento.apostas_redundantes')
+        else:
+            mantidas.append(aposta)
+    return mantidas
+
+
+def _local_para_global(locais, dezenas):
+    """Converte máscaras sobre as posições de `dezenas` em máscaras de 25 bits (número n -> bit n-1)."""
+    import numpy as np
+    globais = np.zeros(len(locais), dtype=np.uint32)
+    for posicao, num in enumerate(dezenas):
+        globais |= ((locais >> np.uint32(posicao)) & np.uint32(1)) << np.uint32(num - 1)
+    return globais
+
+
+@perfil.cronometrado
+def gerar_fechamento_garantido(dezenas, garantia=14, tentativas=5, semente=None, formato='listas',
+                               limite=LIMITE_VIZINHOS):
+    """Gera um fechamento das dezenas escolhidas com garantia mínima de acertos.
+
+    Se os 15 números sorteados estiverem entre as `dezenas`, pelo menos uma aposta acerta
+    `garantia` números. A busca é gulosa com desempates aleatórios, seguida da remoção de
+    apostas redundantes; fica com o menor fechamento entre as `tentativas`.
+
+    Args:
+      dezenas: de 15 a 25 números distintos entre 1 e 25 (lista ou tipos.Combinacao).
+      garantia: acertos garantidos (11 a 15).
+      tentativas: quantas buscas independentes fazer.
+      semente: semente para reproduzir o resultado.
+      formato: 'listas' ou 'apostas' (tipos.LoteApostas).
+      limite: máximo de pares aposta-sorteio (C(dezenas, 15) x vizinhos de cada combinação);
+        acima dele o fechamento é recusado com ValueError antes de qualquer alocação.
+
+    Returns:
+      Lista de apostas (listas ordenadas de 15 números) ou LoteApostas.
+    """
+    import numpy as np
+    from math import comb
+    from . import sorteios
+    dezenas = sorted(set(dezenas))
+    if not 15 <= len(dezenas) <= 25 or any(num < 1 or num > 25 for num in dezenas):
+        raise ValueError("Informe de 15 a 25 dezenas válidas entre 1 e 25.")
+    if not 11 <= garantia <= 15:
+        raise ValueError("A garantia deve ficar entre 11 e 15 acertos.")
+    entradas = comb(len(dezenas), 15) * _largura(len(dezenas), 15 - garantia)
+    if entradas > limite:
+        raise ValueError(f"Fechamento de {len(dezenas)} dezenas com garantia {garantia} é grande demais "
+                         f"({entradas:,} pares aposta-sorteio; limite {limite:,}). "
+                         "Use menos dezenas ou uma garantia maior.")
+
+    candidatas = sorteios.combinacoes_mascaras(len(dezenas), 15)
+    vizinhanca = _Vizinhanca(candidatas, len(dezenas), 15 - garantia)
+    rng = np.random.default_rng(semente)
+    melhor = None
+    for _ in range(tentativas):
+        escolhidas = _remover_redundantes(_cobertura_gulosa(vizinhanca, rng), vizinhanca, rng)
+        if melhor is None or len(escolhidas) < len(melhor):
+            melhor = escolhidas
+    apostas = _local_para_global(candidatas[np.sort(melhor)], dezenas)
+    if formato == 'apostas':
+        from . import tipos
+        return tipos.LoteApostas(apostas)
+    return [sorteios.decodificar_mascara(aposta) for aposta in apostas]
+
+
+@perfil.cronometrado
+def avaliar_fechamento(apostas, dezenas, garantia=14, bloco=1 << 22):
+    """Confere um fechamento contra todos os sorteios possíveis dentro das dezenas.
+
+    Para cada combinação de 15 das `dezenas`, calcula o maior número de acertos entre as apostas
+    (popcount do AND das máscaras), em blocos vetorizados. `apostas` pode ser uma lista de listas,
+    de tipos.Aposta ou um tipos.LoteApostas.
+
+    Returns:
+      Dicionário com 'sorteios' (total avaliado), 'cobertos' (com pelo menos `garantia` acertos)
+      e 'melhor_acerto' ({acertos: quantidade de sorteios}).
+    """
+    import numpy as np
+    from math import comb
+    from . import sorteios
+    dezenas = sorted(set(dezenas))
+    if hasattr(apostas, 'mascaras'):  # tipos.LoteApostas: as máscaras já estão prontas
+        mascaras_apostas = np.asarray(apostas, dtype=np.uint32)
+    else:
+        mascaras_apostas = np.array([sorteios.codificar_sorteio(aposta) for aposta in apostas], dtype=np.uint32)
+    possiveis = _local_para_global(sorteios.combinacoes_mascaras(len(dezenas), 15), dezenas)
+    melhor = np.empty(len(possiveis), dtype=np.uint8)
+    passo = max(1, bloco // max(1, len(mascaras_apostas)))
+    for inicio in range(0, len(possiveis), passo):
+        trecho = possiveis[inicio:inicio + passo, None] & mascaras_apostas
+        melhor[inicio:inicio + passo] = sorteios.contar_bits(trecho).max(axis=1)
+    acertos, quantidades = np.unique(melhor, return_counts=True)
+    return {
+        'sorteios': len(possiveis),
+        'cobertos': int(np.count_nonzero(melhor >= garantia)),
+        'melhor_acerto': {int(a): int(q) for a, q in zip(acertos, quantidades)},
+    }
+
+
+def _ler_grupo_principal():
+    """Pede as 10 dezenas do grupo principal até receber uma entrada válida."""
+    while True:
+        try:
+            grupo_principal_str = input("Digite as 10 dezenas do grupo principal separadas por vírgula (ex: 2,4,6,7,8,10,12,15,16,17): ")
+            grupo_principal = [int(num) for num in grupo_principal_str.split(',')]
+            if len(grupo_principal) != 10 or any(num < 1 or num > 25 for num in grupo_principal):
+                print("Por favor, insira 10 dezenas válidas entre 1 e 25.")
+                continue
+            return grupo_principal
+        except ValueError:
+            print("Entrada inválida. Por favor, insira apenas números inteiros separados por vírgula.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera um fechamento a partir de 10 dezenas principais.")
+    parser.add_argument('dezenas', nargs='*', type=int,
+                        help="as 10 dezenas do grupo principal (pedidas no terminal se omitidas)")
+    args = parser.parse_args(argv)
+
+    # Entrada Manual das 10 Dezenas
+    grupo_principal = args.dezenas
+    if len(grupo_principal) != 10 or any(num < 1 or num > 25 for num in grupo_principal):
+        if grupo_principal:
+            print("Por favor, insira 10 dezenas válidas entre 1 e 25.")
+        grupo_principal = _ler_grupo_principal()
+
+    # Gerar Grupos A, B e C Automaticamente
+    todos_numeros = list(range(1, 26))
+    grupo_a_b_c = [num for num in todos_numeros if num not in grupo_principal]
+    random.shuffle(grupo_a_b_c)
+    grupo_a = grupo_a_b_c[:5]
+    grupo_b = grupo_a_b_c[5:10]
+    grupo_c = grupo_a_b_c[10:15]
+
+    apostas = gerar_fechamento(grupo_principal, grupo_a, grupo_b, grupo_c)
+
+    print("\nApostas geradas:")
+    for i, aposta in enumerate(apostas):
+        print(f"Aposta {i + 1}: {aposta}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,121 @@
+import argparse
+from . import graficos
+
+# pandas, numpy e matplotlib são importados nas funções que desenham, não na importação do módulo.
+
+
+# Função para gerar dados simulados (mantido como antes)
+def generate_candlestick_data(num_points=100):
+    import numpy as np
+    import pandas as pd
+    dates = pd.date_range("2024-01-01", periods=num_points, freq="h")
+    open_prices = np.random.rand(num_points) * 50 + 100  # Preços de abertura base
+    high_prices = open_prices + np.random.rand(num_points) * 10  # Preços máximos
+    low_prices = open_prices - np.random.rand(num_points) * 10  # Preços mínimos
+    close_prices = open_prices + np.random.randn(num_points) * 5  # Preços de fechamento variam mais
+
+    # Ajuste para garantir que os preços de máximos e mínimos estejam corretos
+    high_prices = np.maximum(high_prices, np.maximum(open_prices, close_prices))
+    low_prices = np.minimum(low_prices, np.minimum(open_prices, close_prices))
+
+    df = pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": open_prices,
+            "High": high_prices,
+            "Low": low_prices,
+            "Close": close_prices,
+        }
+    )
+    return df
+
+
+def desenhar_candles(ax, df):
+    """Desenha os candles de uma vez: corpos em uma PolyCollection e sombras em uma LineCollection.
+
+    Evita criar um Rectangle e uma linha por candle, o que torna o desenho lento com milhares de pontos.
+    """
+    import matplotlib.dates as mdates
+    import numpy as np
+    from matplotlib.collections import LineCollection, PolyCollection
+    datas = mdates.date2num(df["Date"])
+    abertura = df["Open"].to_numpy()
+    fechamento = df["Close"].to_numpy()
+
+    # Largura do candle ajustada
+    width = 4 / len(df)
+
+    # Corpos: retângulos entre abertura e fechamento, azuis na alta e vermelhos na baixa
+    esquerda, direita = datas - width / 2, datas + width / 2
+    corpos = np.stack([
+        np.column_stack([esquerda, abertura]),
+        np.column_stack([direita, abertura]),
+        np.column_stack([direita, fechamento]),
+        np.column_stack([esquerda, fechamento]),
+    ], axis=1)
+    cores = np.where(fechamento > abertura, "blue", "red")
+
+    # Sombras (máximo e mínimo)
+    sombras = np.stack([
+        np.column_stack([datas, df["Low"].to_numpy()]),
+        np.column_stack([datas, df["High"].to_numpy()]),
+    ], axis=1)
+
+    ax.add_collection(LineCollection(sombras, colors="white", linewidths=1))
+    ax.add_collection(PolyCollection(corpos, facecolors=cores, edgecolors="white"))
+    ax.autoscale_view()
+
+
+def gerar_grafico_candles(df, period=20, arquivo=None):
+    """Gera o gráfico de candlestick com a Média Móvel Simples (SMA) de `period` períodos.
+
+    Com `arquivo` o gráfico é gravado (PNG/SVG pela extensão) em vez de aberto em uma janela.
+    """
+    import matplotlib.dates as mdates
+    sma = df['Close'].rolling(window=period).mean()
+
+    fig, ax = graficos.nova_figura((12, 6), arquivo)
+
+    # Definir a cor de fundo do gráfico para preto
+    ax.set_facecolor('black')
+
+    desenhar_candles(ax, df)
+
+    # Plotar a linha da SMA
+    ax.plot(df['Date'], sma, color='blue', label=f'SMA ({period})', linewidth=1.5)
+    # Posição fixa: loc="best" varre todos os pontos da figura e domina o tempo com muitos candles
+    ax.legend(loc='upper left', facecolor='black', labelcolor='white')
+
+    # Formatar o eixo X para datas
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d %H:%M"))
+    for rotulo in ax.get_xticklabels():
+        rotulo.set_rotation(45)
+        rotulo.set_horizontalalignment("right")
+    ax.tick_params(axis='x', colors='white')
+
+    # Adicionar títulos e rótulos
+    ax.set_title("Gráfico de Candlestick com SMA", color='white')
+    ax.set_xlabel("Data", color='white')
+    ax.set_ylabel("Preço", color='white')
+    ax.grid(True, color='gray')
+    ax.tick_params(axis='y', colors='white')
+
+    fig.tight_layout()
+    graficos.finalizar(fig, arquivo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gráfico de candlestick com SMA sobre dados simulados.")
+    parser.add_argument('arquivo', nargs='?', help="grava o gráfico (PNG/SVG) em vez de abrir uma janela")
+    parser.add_argument('--pontos', type=int, default=100, help="quantidade de candles")
+    parser.add_argument('--periodo', type=int, default=20, help="períodos da SMA")
+    args = parser.parse_args(argv)
+
+    # Criar os dados
+    df = generate_candlestick_data(args.pontos)
+    gerar_grafico_candles(df, period=args.periodo, arquivo=args.arquivo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from concurrent.futures import ProcessPoolExecutor
+
+
+def nova_figura(figsize, arquivo=None):
+    """Cria a figura e o eixo de um gráfico.
+
+    Sem `arquivo` usa o pyplot (janela interativa). Com `arquivo` cria uma Figure avulsa, sem
+    pyplot nem backend de janela, que pode ser renderizada em servidores sem display.
+    """
+    if arquivo is None:
+        import matplotlib.pyplot as plt
+        figura = plt.figure(figsize=figsize)
+    else:
+        from matplotlib.figure import Figure
+        figura = Figure(figsize=figsize)
+    return figura, figura.add_subplot()
+
+
+def finalizar(figura, arquivo=None, **opcoes):
+    """Mostra a figura (sem `arquivo`) ou grava em PNG/SVG/PDF conforme a extensão do arquivo."""
+    if arquivo is None:
+        import matplotlib.pyplot as plt
+        plt.show()
+    else:
+        figura.savefig(arquivo, **opcoes)
+
+
+def _executar(tarefa):
+    """Executa uma tarefa (funcao, args, kwargs) em um processo de trabalho."""
+    funcao, args, kwargs = tarefa
+    funcao(*args, **kwargs)
+    return kwargs.get('arquivo')
+
+
+def renderizar_em_paralelo(tarefas, processos=None):
+    """Renderiza gráficos em processos separados.
+
+    Args:
+      tarefas: lista de (funcao, args, kwargs); a função deve ser de nível de módulo e os kwargs
+        devem incluir 'arquivo'.
+      processos: tamanho do pool (padrão: número de CPUs).
+
+    Returns:
+      Lista dos arquivos gerados, na ordem das tarefas.
+    """
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        return list(pool.map(_executar, tarefas))
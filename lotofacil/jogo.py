@@ -0,0 +1,462 @@
+import argparse
+import os
+import random
+import numpy as np
+from . import amostragem
+from . import perfil
+from . import sorteios
+from . import tipos
+from .estatisticas import EstatisticasMoveis, serie_frequencia
+
+
+@perfil.cronometrado
+def carregar_dados(caminho_arquivo):
+    """Carrega os dados de um arquivo CSV e seleciona as colunas de números.
+
+    Os sorteios vêm do cache binário de máscaras (sorteios.carregar_mascaras); o CSV só é
+    relido quando muda.
+    """
+    try:
+        mascaras = sorteios.carregar_mascaras(caminho_arquivo)
+        return sorteios.mascaras_para_dataframe(mascaras)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo não encontrado em {caminho_arquivo}")
+        return None
+
+
+@perfil.cronometrado
+def calcular_frequencia_numeros(df):
+    """Calcula a frequência de cada número."""
+    import pandas as pd
+    valores = np.asarray(df)
+    if valores.ndim == 1:  # Máscaras (por exemplo, tipos.Historico)
+        return serie_frequencia(sorteios.mascaras_para_incidencia(valores).sum(axis=0, dtype=np.int64))
+    todos_numeros = df.values.flatten()
+    frequencia = pd.Series(todos_numeros).value_counts().sort_index()
+    return frequencia
+
+
+def _numeros_para_incidencia(numeros):
+    """Vetor booleano de 25 posições com os números informados."""
+    incidencia = np.zeros(25, dtype=bool)
+    incidencia[np.asarray(numeros, dtype=np.int64) - 1] = True
+    return incidencia
+
+
+def _escolher_por_linha(gerador, disponiveis, quantidade):
+    """Escolhe, em cada linha, `quantidade` números uniformemente entre os disponíveis.
+
+    Args:
+      disponiveis: array booleano (apostas x 25).
+      quantidade: inteiro ou array (um valor por aposta).
+
+    Returns:
+      Array booleano (apostas x 25) com os números escolhidos.
+    """
+    chaves = np.where(disponiveis, gerador.random(disponiveis.shape), 2.0)
+    quantidade = np.broadcast_to(np.asarray(quantidade, dtype=np.int64), disponiveis.shape[:1])
+    ordenadas = np.sort(chaves, axis=1)
+    limiar = np.take_along_axis(ordenadas, np.clip(quantidade - 1, 0, 24)[:, None], axis=1)
+    return disponiveis & (chaves <= limiar) & (quantidade[:, None] > 0)
+
+
+def _montar_lote(gerar, quantidade, formato='matriz', unicos=False, excluir=None, rodadas=100, bloco=1 << 20):
+    """Gera um lote de apostas, opcionalmente sem repetições e sem apostas já sorteadas.
+
+    Args:
+      gerar: função que recebe n e devolve n apostas como máscaras uint32.
+      formato: 'matriz' (array uint8 quantidade x 15), 'mascaras' (array uint32) ou 'apostas'
+        (tipos.LoteApostas).
+      unicos: descarta apostas repetidas dentro do lote.
+      excluir: máscaras a descartar (por exemplo, sorteios.carregar_mascaras do histórico).
+      rodadas: limite de gerações para completar o lote depois dos descartes.
+      bloco: apostas por chamada de `gerar`; limita a memória temporária de lotes grandes.
+    """
+    if formato not in ('matriz', 'mascaras', 'apostas'):
+        raise ValueError(f"Formato desconhecido: {formato}")
+    mascaras = np.zeros(0, dtype=np.uint32)
+    excluir = None if excluir is None else np.unique(np.asarray(excluir, dtype=np.uint32))
+    for _ in range(rodadas):
+        faltam = quantidade - len(mascaras)
+        if faltam <= 0:
+            break
+        novas = np.concatenate([gerar(min(bloco, faltam - inicio)) for inicio in range(0, faltam, bloco)])
+        if excluir is not None:
+            novas = novas[~np.isin(novas, excluir)]
+        mascaras = np.concatenate([mascaras, novas])
+        if unicos:
+            _, primeiras = np.unique(mascaras, return_index=True)
+            mascaras = mascaras[np.sort(primeiras)]
+    if len(mascaras) < quantidade:
+        raise ValueError(f"Não foi possível gerar {quantidade} apostas com as restrições pedidas")
+    mascaras = mascaras[:quantidade]
+    if formato == 'apostas':
+        return tipos.LoteApostas(mascaras)
+    return sorteios.mascaras_para_matriz(mascaras) if formato == 'matriz' else mascaras
+
+
+@perfil.cronometrado
+def gerar_combinacao_mais_frequentes(frequencia, quantidade=15):
+    """Gera combinação com os números mais frequentes."""
+    mais_frequentes = frequencia.nlargest(quantidade).index.tolist()
+    return sorted(random.sample(mais_frequentes, 15))
+
+
+@perfil.cronometrado
+def gerar_lote_mais_frequentes(quantidade, gerador, frequencia, tamanho_grupo=15, formato='matriz', unicos=False,
+                               excluir=None):
+    """Gera um lote de combinações com 15 dos `tamanho_grupo` números mais frequentes."""
+    grupo = _numeros_para_incidencia(frequencia.nlargest(tamanho_grupo).index)
+
+    def gerar(n):
+        escolhidos = _escolher_por_linha(gerador, np.broadcast_to(grupo, (n, 25)), 15)
+        return sorteios.incidencia_para_mascaras(escolhidos)
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+@perfil.cronometrado
+def gerar_combinacao_menos_frequentes(frequencia, quantidade=15):
+    """Gera combinação com os números menos frequentes."""
+    menos_frequentes = frequencia.nsmallest(25).index.tolist()  # Lista com os 25 números menos frequentes
+    if len(menos_frequentes) < 15:
+        numeros_faltando = 15 - len(menos_frequentes)
+        numeros_aleatorios = [num for num in range(1, 26) if num not in menos_frequentes]
+        menos_frequentes.extend(random.sample(numeros_aleatorios, numeros_faltando))
+    return sorted(random.sample(menos_frequentes, 15))
+
+
+@perfil.cronometrado
+def gerar_lote_menos_frequentes(quantidade, gerador, frequencia, formato='matriz', unicos=False, excluir=None):
+    """Gera um lote de combinações com os números menos frequentes.
+
+    Como em gerar_combinacao_menos_frequentes, se menos de 15 números tiverem saído, os que
+    faltam são sorteados entre os que nunca saíram.
+    """
+    grupo = _numeros_para_incidencia(frequencia.nsmallest(25).index)
+    faltando = max(0, 15 - int(grupo.sum()))
+
+    def gerar(n):
+        escolhidos = _escolher_por_linha(gerador, np.broadcast_to(grupo, (n, 25)), 15)
+        if faltando:
+            escolhidos |= _escolher_por_linha(gerador, np.broadcast_to(~grupo, (n, 25)), faltando)
+        return sorteios.incidencia_para_mascaras(escolhidos)
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+@perfil.cronometrado
+def gerar_combinacao_mix_frequencias(frequencia, quantidade_mais=7, quantidade_menos=8):
+    """Gera combinação com mix de números mais e menos frequentes."""
+    mais_frequentes = frequencia.nlargest(quantidade_mais).index.tolist()
+    menos_frequentes = frequencia.nsmallest(quantidade_menos).index.tolist()
+    combinacao = random.sample(mais_frequentes, quantidade_mais) + random.sample(menos_frequentes, quantidade_menos)
+    return sorted(random.sample(combinacao, 15))
+
+
+@perfil.cronometrado
+def gerar_lote_mix_frequencias(quantidade, gerador, frequencia, quantidade_mais=7, quantidade_menos=8,
+                               formato='matriz', unicos=False, excluir=None):
+    """Gera um lote de combinações misturando números mais e menos frequentes."""
+    grupo = (_numeros_para_incidencia(frequencia.nlargest(quantidade_mais).index)
+             | _numeros_para_incidencia(frequencia.nsmallest(quantidade_menos).index))
+
+    def gerar(n):
+        escolhidos = _escolher_por_linha(gerador, np.broadcast_to(grupo, (n, 25)), 15)
+        return sorteios.incidencia_para_mascaras(escolhidos)
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+@perfil.cronometrado
+def calcular_somas_sorteios(df):
+    """Calcula a soma dos números em cada sorteio."""
+    valores = np.asarray(df)
+    if valores.ndim == 1:  # Máscaras (por exemplo, tipos.Historico)
+        return sorteios.mascaras_para_incidencia(valores) @ np.arange(1, 26)
+    return df.sum(axis=1)
+
+
+@perfil.cronometrado
+def gerar_combinacao_por_soma(df, faixa_soma_min, faixa_soma_max):
+    """Gera combinação com soma dentro de uma faixa.
+
+    Sorteia uniformemente entre as combinações válidas, sem tentativas descartadas.
+    """
+    return amostragem.sortear_por_soma(faixa_soma_min, faixa_soma_max)
+
+
+@perfil.cronometrado
+def gerar_lote_por_soma(quantidade, gerador, faixa_soma_min, faixa_soma_max, formato='matriz', unicos=False,
+                        excluir=None):
+    """Gera um lote de combinações com soma na faixa (amostragem uniforme e exata)."""
+    def gerar(n):
+        return sorteios.matriz_para_mascaras(amostragem.sortear_lote_por_soma(n, faixa_soma_min, faixa_soma_max,
+                                                                              gerador))
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+def _contagem_por_numero(df):
+    """Conta, em uma única passada, quantas vezes cada número (1 a 25) aparece em cada sorteio.
+
+    Retorna um array (sorteios x 25); células inválidas são ignoradas. Também aceita máscaras
+    (array 1D ou tipos.Historico).
+    """
+    matriz = np.asarray(df)
+    if matriz.ndim == 1:
+        return sorteios.mascaras_para_incidencia(matriz).astype(np.uint8)
+    validos = sorteios.validar_matriz(matriz)
+    n_sorteios = matriz.shape[0]
+    indices = np.where(validos, matriz, 1).astype(np.intp) - 1
+    indices += np.arange(n_sorteios, dtype=np.intp)[:, None] * 25
+    contagem = np.bincount(indices[validos], minlength=n_sorteios * 25)
+    return contagem.reshape(n_sorteios, 25).astype(np.uint8)
+
+
+@perfil.cronometrado
+def calcular_pares_impares(df):
+    """Calcula quantidade de pares e impares por sorteio.
+
+    Retorna um array uint8 (sorteios x 2) com as colunas [pares, impares]. Células inválidas
+    (NaN, fora de 1 a 25) não são contadas; use sorteios.validar_matriz para localizá-las.
+    """
+    contagem = _contagem_por_numero(df)
+    pares = contagem[:, 1::2].sum(axis=1, dtype=np.uint8)
+    impares = contagem[:, 0::2].sum(axis=1, dtype=np.uint8)
+    return np.stack([pares, impares], axis=1)
+
+
+def _faixa_pares(mais_pares):
+    """Faixa de pares aceita: mais pares (7 ou mais) ou mais ímpares (7 ou mais ímpares)."""
+    return (7, 15) if mais_pares else (0, 8)
+
+
+@perfil.cronometrado
+def gerar_combinacao_por_pares_impares(pares_impares_analise, mais_pares=True):
+    """Gera uma combinação baseada no padrão de pares e impares"""
+    return amostragem.sortear_por_pares(*_faixa_pares(mais_pares))
+
+
+@perfil.cronometrado
+def gerar_lote_por_pares_impares(quantidade, gerador, mais_pares=True, formato='matriz', unicos=False, excluir=None):
+    """Gera um lote de combinações do padrão de pares e ímpares (amostragem uniforme e exata)."""
+    def gerar(n):
+        return sorteios.matriz_para_mascaras(amostragem.sortear_lote_por_pares(n, *_faixa_pares(mais_pares), gerador))
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+@perfil.cronometrado
+def analisar_distribuicao_por_linha_coluna(df):
+    """Analisa a distribuição dos números por linha e coluna no volante da Lotofácil.
+
+    Retorna {'linhas': array uint8 (sorteios x 5), 'colunas': array uint8 (sorteios x 10)}.
+    Células inválidas não são contadas; use sorteios.validar_matriz para localizá-las.
+    """
+    linhas, colunas = sorteios.linhas_colunas(_contagem_por_numero(df))
+    return {'linhas': linhas, 'colunas': colunas}
+
+
+@perfil.cronometrado
+def gerar_combinacao_por_distribuicao(distribuicao_analise, linhas_escolhidas, colunas_escolhidas):
+    """Gera combinação baseada na distribuição por linha e coluna."""
+    combinacao = []
+    linhas_usadas = []
+    for l in linhas_escolhidas:
+        numeros_linha = [num for num in range(1, 26) if (num - 1) // 5 == l]
+        linha = random.sample(numeros_linha, linhas_escolhidas[l])
+        combinacao.extend(linha)
+        linhas_usadas.extend(linha)
+
+    colunas_disponiveis = set(colunas_escolhidas)  # Usando set para eficiência
+
+    # Calcula quantos números faltam
+    numeros_faltando = 15 - len(combinacao)
+
+    # Gera os números restantes de uma vez
+    numeros_restantes = []
+    todos_numeros = list(range(1, 26))
+    random.shuffle(todos_numeros)
+
+    combinacao_set = set(combinacao)
+
+    for num in todos_numeros:
+        if len(numeros_restantes) == numeros_faltando:
+            break
+        coluna = (num - 1) % 10
+        if coluna in colunas_disponiveis and num not in combinacao_set:
+            numeros_restantes.append(num)
+            combinacao_set.add(num)
+        else:
+            perfil.contar('jogo.gerar_combinacao_por_distribuicao.descartados')
+
+    combinacao.extend(numeros_restantes)
+    return sorted(combinacao)
+
+
+@perfil.cronometrado
+def gerar_lote_por_distribuicao(quantidade, gerador, linhas_escolhidas, colunas_escolhidas, formato='matriz',
+                                unicos=False, excluir=None):
+    """Gera um lote de combinações baseadas na distribuição por linha e coluna.
+
+    Mesma regra de gerar_combinacao_por_distribuicao: os números pedidos de cada linha e o
+    restante entre as colunas escolhidas. Se as colunas não tiverem números suficientes, a
+    aposta fica com menos de 15 números (completada com 0 no formato 'matriz').
+    """
+    numeros = np.arange(1, 26)
+    na_coluna = np.isin((numeros - 1) % 10, list(colunas_escolhidas))
+
+    def gerar(n):
+        escolhidos = np.zeros((n, 25), dtype=bool)
+        for linha, quantidade_linha in linhas_escolhidas.items():
+            na_linha = np.broadcast_to((numeros - 1) // 5 == linha, (n, 25))
+            escolhidos |= _escolher_por_linha(gerador, na_linha, quantidade_linha)
+        faltando = 15 - escolhidos.sum(axis=1)
+        escolhidos |= _escolher_por_linha(gerador, na_coluna & ~escolhidos, faltando)
+        return sorteios.incidencia_para_mascaras(escolhidos)
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+@perfil.cronometrado
+def gerar_combinacao_por_pesos(pesos):
+    """Gera combinação sorteando 15 números sem reposição, com probabilidade proporcional aos pesos.
+
+    Args:
+      pesos: 25 pesos positivos (posição 0 = número 1), por exemplo atraso.Atrasos.pesos().
+    """
+    chaves = {num: random.random() ** (1.0 / peso) for num, peso in enumerate(pesos, start=1)}
+    return sorted(sorted(chaves, key=chaves.get, reverse=True)[:15])
+
+
+@perfil.cronometrado
+def gerar_lote_por_pesos(quantidade, gerador, pesos, formato='matriz', unicos=False, excluir=None):
+    """Gera um lote de combinações com a mesma regra de gerar_combinacao_por_pesos.
+
+    Cada número recebe a chave u ** (1 / peso), com u uniforme, e os 15 maiores entram
+    (amostragem ponderada sem reposição de Efraimidis-Spirakis, em log para não perder precisão).
+    """
+    pesos = np.asarray(pesos, dtype=np.float64)
+    if pesos.shape != (25,) or not (pesos > 0).all():
+        raise ValueError("Informe 25 pesos positivos.")
+
+    def gerar(n):
+        chaves = np.log(gerador.random((n, 25))) / pesos
+        maiores = np.argpartition(-chaves, 14, axis=1)[:, :15]
+        escolhidos = np.zeros((n, 25), dtype=bool)
+        np.put_along_axis(escolhidos, maiores, True, axis=1)
+        return sorteios.incidencia_para_mascaras(escolhidos)
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+@perfil.cronometrado
+def _validar_fixos(fixos):
+    """Números fixos distintos e ordenados; ValueError se algum estiver fora de 1 a 25 ou passarem de 15."""
+    fixos = sorted(set(int(num) for num in fixos or ()))
+    if any(num < 1 or num > sorteios.NUMEROS for num in fixos):
+        raise ValueError(f"Números fixos devem ficar entre 1 e {sorteios.NUMEROS}: {fixos}")
+    if len(fixos) > sorteios.DEZENAS_POR_SORTEIO:
+        raise ValueError(f"No máximo {sorteios.DEZENAS_POR_SORTEIO} números fixos, recebeu {len(fixos)}")
+    return fixos
+
+
+def gerar_combinacao_por_coocorrencia(coocorrencia, fixos=None):
+    """Gera combinação escolhendo cada número com peso proporcional aos pares já formados.
+
+    Parte dos `fixos` (ou de um número sorteado pela frequência) e acrescenta um número por vez,
+    com peso igual à soma das vezes em que ele saiu junto com os já escolhidos.
+    """
+    fixos = _validar_fixos(fixos)
+    pesos = coocorrencia.pesos_pares()
+    combinacao = list(fixos or random.choices(range(1, 26), weights=np.diag(coocorrencia.pares) + 1))
+    while len(combinacao) < 15:
+        afinidade = pesos[np.array(combinacao) - 1].sum(axis=0) + 1
+        afinidade[np.array(combinacao) - 1] = 0
+        combinacao.extend(random.choices(range(1, 26), weights=afinidade))
+    return sorted(combinacao)
+
+
+@perfil.cronometrado
+def gerar_lote_por_coocorrencia(quantidade, gerador, coocorrencia, fixos=None, formato='matriz', unicos=False,
+                                excluir=None):
+    """Gera um lote de combinações com a mesma regra de gerar_combinacao_por_coocorrencia."""
+    fixos = _validar_fixos(fixos)
+    pesos = coocorrencia.pesos_pares()
+    frequencia = np.diag(coocorrencia.pares).astype(np.float64) + 1
+
+    def sortear_um(escolhidos, pesos_linha):
+        acumulado = np.cumsum(np.where(escolhidos, 0.0, pesos_linha), axis=1)
+        alvo = gerador.random(len(acumulado))[:, None] * acumulado[:, -1:]
+        posicao = np.minimum((acumulado <= alvo).sum(axis=1), 24)
+        escolhidos[np.arange(len(escolhidos)), posicao] = True
+
+    def gerar(n):
+        escolhidos = np.zeros((n, 25), dtype=bool)
+        if fixos:
+            escolhidos[:, np.asarray(fixos) - 1] = True
+        else:
+            sortear_um(escolhidos, np.broadcast_to(frequencia, (n, 25)))
+        for _ in range(15 - int(escolhidos[0].sum())):
+            sortear_um(escolhidos, escolhidos @ pesos + 1)
+        return sorteios.incidencia_para_mascaras(escolhidos)
+
+    return _montar_lote(gerar, quantidade, formato, unicos, excluir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analisa o histórico e sugere combinações por estratégia.")
+    parser.add_argument('caminho_arquivo', nargs='?', default=sorteios.CAMINHO_PADRAO, help="CSV de resultados")
+    args = parser.parse_args(argv)
+
+    try:
+        mascaras = sorteios.carregar_mascaras(args.caminho_arquivo)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo não encontrado em {args.caminho_arquivo}")
+        return
+    # Linhas inválidas já foram descartadas na leitura e listadas no relatório de rejeitados
+    rejeitados = sorteios.caminho_rejeitados(args.caminho_arquivo)
+    if os.path.exists(rejeitados):
+        print(f"Aviso: linhas inválidas do CSV foram ignoradas; veja {rejeitados}")
+
+    # As análises do histórico todo saem do cache em disco (memoria.CacheAnalises) quando o
+    # histórico não mudou, ou são estendidas só com os concursos novos
+    from . import memoria
+    cache = memoria.CacheAnalises()
+
+    # Calcular a frequência dos números nos últimos 6 jogos
+    frequencia_ultimos_6 = EstatisticasMoveis(mascaras[-6:]).serie_frequencia()
+
+    # Obter os números mais e menos frequentes
+    mais_frequentes_ultimos_6 = frequencia_ultimos_6.nlargest(15).index.tolist()
+    menos_frequentes_ultimos_6 = frequencia_ultimos_6.nsmallest(15).index.tolist()
+
+    # Exibir os resultados
+    print("Números Mais Frequentes nos Últimos 6 Jogos:", mais_frequentes_ultimos_6)
+    print("Números Menos Frequentes nos Últimos 6 Jogos:", menos_frequentes_ultimos_6)
+
+    frequencia_numeros = serie_frequencia(cache.obter('frequencia', mascaras)['contagem'])
+    por_sorteio = cache.obter('por_sorteio', mascaras)
+    somas_sorteios = por_sorteio['somas']
+    pares_impares_sorteios = por_sorteio['pares_impares']
+    distribuicao_analise = {'linhas': por_sorteio['linhas'], 'colunas': por_sorteio['colunas']}
+
+    # Exemplos de geração de combinações
+    print("Combinação Mais Frequentes:", gerar_combinacao_mais_frequentes(frequencia_numeros))
+    print("Combinação Menos Frequentes:", gerar_combinacao_menos_frequentes(frequencia_numeros))
+    print("Combinação Mix Frequências:", gerar_combinacao_mix_frequencias(frequencia_numeros))
+    print("Combinação Por Soma (180-220):", gerar_combinacao_por_soma(mascaras, 180, 220))
+    print("Combinação Mais Pares:", gerar_combinacao_por_pares_impares(pares_impares_sorteios, mais_pares=True))
+    print("Combinação Mais Impares:", gerar_combinacao_por_pares_impares(pares_impares_sorteios, mais_pares=False))
+
+    # Escolhendo 2 números na linha 0 e 3 números na linha 2
+    linhas_escolhidas = {0: 2, 2: 3}
+    # Escolhendo a coluna 1 e 4
+    colunas_escolhidas = [1, 4]
+    print("Combinação por Linhas e Colunas",
+          gerar_combinacao_por_distribuicao(distribuicao_analise, linhas_escolhidas, colunas_escolhidas))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import numpy as np
+from . import perfil
+from . import sorteios
+
+DIRETORIO_PADRAO = os.path.join(os.path.expanduser('~'), '.cache', 'lotofacil', 'analises')
+LIMITE_PADRAO = 256 << 20  # bytes
+
+# Sorteios anteriores ao trecho novo que uma extensão precisa rever (maior defasagem analisada).
+_DEFASAGENS = (1, 2, 3)
+
+
+def impressao(mascaras):
+    """Impressão digital do histórico: quantidade de sorteios e hash do conteúdo das máscaras."""
+    mascaras = np.ascontiguousarray(mascaras, dtype='<u4')
+    return len(mascaras), hashlib.blake2b(mascaras.tobytes(), digest_size=16).hexdigest()
+
+
+# Cada análise recebe as máscaras e devolve um dicionário de arrays. `estender` recebe o resultado
+# já calculado para mascaras[:inicio] e devolve o resultado para todas as máscaras, processando só
+# o trecho novo. Mudar o cálculo de uma análise exige incrementar sua versão.
+
+def _frequencia(mascaras):
+    return {'contagem': sorteios.mascaras_para_incidencia(mascaras).sum(axis=0, dtype=np.int64)}
+
+
+def _estender_frequencia(resultado, mascaras, inicio):
+    return {'contagem': resultado['contagem'] + _frequencia(mascaras[inicio:])['contagem']}
+
+
+def _por_sorteio(mascaras):
+    incidencia = sorteios.mascaras_para_incidencia(mascaras)
+    numeros = np.arange(1, sorteios.NUMEROS + 1, dtype=np.int64)
+    linhas, colunas = sorteios.linhas_colunas(incidencia)
+    return {
+        'somas': incidencia @ numeros,
+        'pares_impares': np.stack([incidencia[:, 1::2].sum(axis=1, dtype=np.uint8),
+                                   incidencia[:, 0::2].sum(axis=1, dtype=np.uint8)], axis=1),
+        'linhas': linhas,
+        'colunas': colunas,
+    }
+
+
+def _estender_por_sorteio(resultado, mascaras, inicio):
+    novo = _por_sorteio(mascaras[inicio:])
+    return {nome: np.concatenate([resultado[nome], valores]) for nome, valores in novo.items()}
+
+
+def _repeticoes(mascaras):
+    from . import padroes
+
+    incidencia = sorteios.mascaras_para_incidencia(mascaras)
+    return {
+        'defasagens': padroes.contar_repeticoes_por_defasagem(incidencia, _DEFASAGENS),
+        'geral': incidencia.sum(axis=0, dtype=np.int64),
+    }
+
+
+def _estender_repeticoes(resultado, mascaras, inicio):
+    from . import padroes
+
+    defasagens = resultado['defasagens'].copy()
+    for linha, k in enumerate(_DEFASAGENS):
+        # Só os pares (i, i + k) com i + k no trecho novo ainda não foram contados
+        trecho = sorteios.mascaras_para_incidencia(mascaras[max(0, inicio - k):])
+        defasagens[linha] += padroes.contar_repeticoes_por_defasagem(trecho, [k])[0]
+    geral = resultado['geral'] + sorteios.mascaras_para_incidencia(mascaras[inicio:]).sum(axis=0, dtype=np.int64)
+    return {'defasagens': defasagens, 'geral': geral}
+
+
+def _sequencias(mascaras, tamanho=3, contiguas=True):
+    from . import padroes
+
+    sequencias = padroes.analisar_sequencias_repetidas(sorteios.mascaras_para_matriz(mascaras), tamanho, contiguas)
+    chaves = np.array([sorteios.codificar_sorteio(seq) for seq in sequencias], dtype=np.uint32)
+    return {'mascaras': chaves, 'contagens': np.array(list(sequencias.values()), dtype=np.int64)}
+
+
+def _estender_sequencias(resultado, mascaras, inicio, tamanho=3, contiguas=True):
+    # Comparações entre sorteios consecutivos: o trecho novo começa no último sorteio já visto
+    novo = _sequencias(mascaras[max(0, inicio - 1):], tamanho, contiguas)
+    chaves = np.concatenate([resultado['mascaras'], novo['mascaras']])
+    contagens = np.concatenate([resultado['contagens'], novo['contagens']])
+    chaves, posicoes = np.unique(chaves, return_inverse=True)
+    return {'mascaras': chaves, 'contagens': np.bincount(posicoes, weights=contagens).astype(np.int64)}
+
+
+# nome -> (versão, calcular(mascaras, **parametros), estender(resultado, mascaras, inicio, **parametros))
+ANALISES = {
+    'frequencia': (1, _frequencia, _estender_frequencia),
+    'por_sorteio': (1, _por_sorteio, _estender_por_sorteio),
+    'repeticoes': (1, _repeticoes, _estender_repeticoes),
+    'sequencias': (1, _sequencias, _estender_sequencias),
+}
+
+
+class CacheAnalises:
+    """Resultados de análises do histórico gravados em disco, um arquivo .npz por resultado.
+
+    O nome do arquivo identifica análise, versão, parâmetros e a impressão digital do histórico
+    (quantidade de sorteios e hash). Se só foram acrescentados concursos desde a última execução,
+    o resultado anterior é estendido com o trecho novo em vez de recalculado. Quando o diretório
+    passa de `limite_bytes`, os resultados usados há mais tempo são apagados (LRU pelo mtime, que
+    é renovado a cada leitura). Se o diretório não puder ser criado ou gravado, os resultados são
+    calculados normalmente, só não ficam em cache (como em sorteios.carregar_mascaras).
+    """
+
+    def __init__(self, diretorio=DIRETORIO_PADRAO, limite_bytes=LIMITE_PADRAO):
+        self.diretorio = diretorio
+        self.limite_bytes = limite_bytes
+
+    def _prefixo(self, nome, parametros):
+        versao = ANALISES[nome][0]
+        chave = json.dumps(parametros, sort_keys=True, default=str).encode()
+        return f'{nome}-v{versao}-{hashlib.blake2b(chave, digest_size=4).hexdigest()}-'
+
+    def _caminho(self, prefixo, quantidade, hash_historico):
+        return os.path.join(self.diretorio, f'{prefixo}{quantidade}-{hash_historico}.npz')
+
+    def _ler(self, caminho):
+        with np.load(caminho) as arquivo:
+            resultado = {nome: arquivo[nome] for nome in arquivo.files}
+        try:
+            os.utime(caminho)
+        except OSError:
+            pass  # Sem permissão de escrita: a ordem do LRU só não é renovada.
+        return resultado
+
+    def _anterior(self, prefixo, mascaras):
+        """Resultado gravado para o maior prefixo do histórico atual, como (inicio, caminho)."""
+        try:
+            arquivos = os.listdir(self.diretorio)
+        except OSError:
+            return None
+        candidatos = []
+        for arquivo in arquivos:
+            if arquivo.startswith(prefixo) and arquivo.endswith('.npz'):
+                quantidade, hash_historico = arquivo[len(prefixo):-len('.npz')].split('-')
+                if int(quantidade) < len(mascaras):
+                    candidatos.append((int(quantidade), hash_historico, arquivo))
+        for quantidade, hash_historico, arquivo in sorted(candidatos, reverse=True):
+            if impressao(mascaras[:quantidade])[1] == hash_historico:
+                return quantidade, os.path.join(self.diretorio, arquivo)
+        return None
+
+    def _gravar(self, caminho, resultado):
+        """Grava o resultado de forma atômica; em diretório inacessível, segue sem cache."""
+        temporario = f'{caminho[:-len(".npz")]}.{os.getpid()}.tmp.npz'
+        try:
+            os.makedirs(self.diretorio, exist_ok=True)
+            np.savez(temporario, **resultado)
+            os.replace(temporario, caminho)
+            self.limpar()
+        except OSError:
+            perfil.contar('memoria.sem_cache')
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+
+    def obter(self, nome, mascaras, **parametros):
+        """Resultado da análise `nome` para o histórico, lido do disco, estendido ou calculado.
+
+        Returns:
+          Dicionário de arrays (ver ANALISES).
+        """
+        _, calcular, estender = ANALISES[nome]
+        mascaras = np.asarray(mascaras, dtype=np.uint32)
+        prefixo = self._prefixo(nome, parametros)
+        caminho = self._caminho(prefixo, *impressao(mascaras))
+        if os.path.exists(caminho):
+            perfil.contar('memoria.acertos')
+            return self._ler(caminho)
+
+        anterior = self._anterior(prefixo, mascaras)
+        if anterior is not None:
+            perfil.contar('memoria.extensoes')
+            inicio, caminho_anterior = anterior
+            resultado = estender(self._ler(caminho_anterior), mascaras, inicio, **parametros)
+            try:
+                os.remove(caminho_anterior)
+            except OSError:
+                pass
+        else:
+            perfil.contar('memoria.falhas')
+            resultado = calcular(mascaras, **parametros)
+        self._gravar(caminho, resultado)
+        return resultado
+
+    def limpar(self, limite_bytes=None):
+        """Apaga os resultados usados há mais tempo até o diretório caber no limite."""
+        limite_bytes = self.limite_bytes if limite_bytes is None else limite_bytes
+        if not os.path.isdir(self.diretorio):
+            return
+        entradas = []
+        for arquivo in os.listdir(self.diretorio):
+            if arquivo.endswith('.npz') and '.tmp' not in arquivo:
+                info = os.stat(os.path.join(self.diretorio, arquivo))
+                entradas.append((info.st_mtime, info.st_size, arquivo))
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        for _, tamanho, arquivo in sorted(entradas):
+            if total <= limite_bytes:
+                break
+            os.remove(os.path.join(self.diretorio, arquivo))
+            total -= tamanho
@@ -0,0 +1,246 @@
+import argparse
+import unicodedata
+from functools import lru_cache
+
+TABELA_PITAGORICA = {
+    'a': 1, 'j': 1, 's': 1,
+    'b': 2, 'k': 2, 't': 2,
+    'c': 3, 'l': 3, 'u': 3,
+    'd': 4, 'm': 4, 'v': 4,
+    'e': 5, 'n': 5, 'w': 5,
+    'f': 6, 'o': 6, 'x': 6,
+    'g': 7, 'p': 7, 'y': 7,
+    'h': 8, 'q': 8, 'z': 8,
+    'i': 9, 'r': 9
+}
+
+NUMEROS_MESTRES = (11, 22, 33)
+
+# Marcas diacríticas combinantes (U+0300 a U+036F): depois da decomposição NFKD, "é" vira "e" + acento.
+_INICIO_ACENTOS, _FIM_ACENTOS = 0x300, 0x370
+_SEM_ACENTOS = dict.fromkeys(range(_INICIO_ACENTOS, _FIM_ACENTOS))
+
+# Separador entre nomes no cálculo em lote (não aparece em nomes nem é alterado pela normalização).
+_SEPARADOR = '\0'
+
+
+def normalizar_nome(nome):
+    """Remove acentos e cedilhas ("José Conceição" -> "jose conceicao") e passa para minúsculas."""
+    return unicodedata.normalize('NFKD', nome).translate(_SEM_ACENTOS).lower()
+
+
+def _soma_digitos(numero):
+    """Soma dos dígitos decimais de um inteiro não negativo."""
+    soma = 0
+    while numero:
+        numero, digito = divmod(numero, 10)
+        soma += digito
+    return soma
+
+
+def _raiz_digital(soma):
+    """Resultado de somar os dígitos até restar um só (forma fechada 1 + (n - 1) % 9)."""
+    return soma if soma <= 9 else 1 + (soma - 1) % 9
+
+
+def calcular_numero_destino(nome_completo):
+    """Calcula o Número de Destino (Expressão) de um nome completo usando a tabela pitagórica.
+
+    Acentos e cedilhas são ignorados ("José" vale o mesmo que "Jose").
+
+    Args:
+      nome_completo: O nome completo da pessoa (string).
+
+    Returns:
+      O Número de Destino (int), ou None se o nome for inválido.
+    """
+    soma_total = 0
+    for letra in normalizar_nome(nome_completo):
+        valor = TABELA_PITAGORICA.get(letra)
+        if valor is not None:
+            soma_total += valor
+        elif letra != " ":
+            return None  # Retorna None se encontrar caracteres inválidos
+
+    while soma_total > 9 and soma_total not in NUMEROS_MESTRES:
+        soma_total = _soma_digitos(soma_total)
+
+    return soma_total
+
+
+def calcular_numero_caminho_vida(data_nascimento):
+    """Calcula o Número do Caminho de Vida a partir da data de nascimento.
+
+    Args:
+      data_nascimento: A data de nascimento no formato DD/MM/AAAA (string).
+
+    Returns:
+      O Número do Caminho de Vida (int), ou None se a data for inválida.
+    """
+    try:
+        dia, mes, ano = map(int, data_nascimento.split('/'))
+        return _raiz_digital(dia + mes + ano)
+    except ValueError:
+        return None  # Retorna None se a data for inválida
+
+
+@lru_cache(maxsize=None)
+def _valores_por_codigo():
+    """Vetor código Unicode -> valor pitagórico, para códigos até _FIM_ACENTOS.
+
+    Letras (maiúsculas e minúsculas) têm seu valor, espaço, separador e acentos combinantes valem 0
+    e os demais caracteres valem -1 (inválido). Códigos maiores usam a última posição (inválido).
+    """
+    import numpy as np
+
+    valores = np.full(_FIM_ACENTOS + 1, -1, dtype=np.int8)
+    for letra, valor in TABELA_PITAGORICA.items():
+        valores[ord(letra)] = valores[ord(letra.upper())] = valor
+    valores[ord(' ')] = valores[ord(_SEPARADOR)] = 0
+    valores[_INICIO_ACENTOS:_FIM_ACENTOS] = 0
+    return valores
+
+
+def _reduzir_destino(somas):
+    """Versão vetorizada da redução do Número de Destino (preserva 11, 22 e 33)."""
+    import numpy as np
+
+    somas = somas.copy()
+    pendentes = (somas > 9) & ~np.isin(somas, NUMEROS_MESTRES)
+    while pendentes.any():
+        restante = somas[pendentes]
+        soma = np.zeros_like(restante)
+        while restante.any():
+            restante, digito = np.divmod(restante, 10)
+            soma += digito
+        somas[pendentes] = soma
+        pendentes = (somas > 9) & ~np.isin(somas, NUMEROS_MESTRES)
+    return somas
+
+
+def calcular_numeros_destino(nomes):
+    """Número de Destino de muitos nomes de uma vez.
+
+    Os nomes são unidos em um único texto, normalizado (NFKD) uma vez só e convertido em um vetor
+    de códigos; o valor de cada letra sai de um vetor de consulta e a soma de cada nome de um
+    reduceat sobre o trecho do nome.
+
+    Args:
+      nomes: sequência de strings (valores ausentes contam como inválidos).
+
+    Returns:
+      Array int8 com o Número de Destino de cada nome, -1 para nomes inválidos.
+    """
+    import numpy as np
+    import pandas as pd
+
+    nomes = pd.Series(nomes, dtype=object)
+    ausentes = nomes.isna().to_numpy()
+    nomes = nomes.where(~ausentes, '')
+    texto = _SEPARADOR.join(nomes) + _SEPARADOR
+    if texto.count(_SEPARADOR) != len(nomes):
+        # Algum nome contém o separador: troca por um caractere inválido para manter o alinhamento
+        texto = _SEPARADOR.join(nomes.str.replace(_SEPARADOR, '\x01')) + _SEPARADOR
+    if texto.isascii():
+        codigos = np.frombuffer(texto.encode('ascii'), dtype=np.uint8)
+    else:
+        codigos = np.frombuffer(unicodedata.normalize('NFKD', texto).encode('utf-32-le'), dtype=np.uint32)
+        codigos = np.minimum(codigos, _FIM_ACENTOS)
+
+    # Cada nome vai do seu início até o separador, inclusive (valor 0), então nenhum trecho é vazio
+    fins = np.flatnonzero(codigos == ord(_SEPARADOR))
+    inicios = np.concatenate([[0], fins[:-1] + 1])
+    valores = _valores_por_codigo()[codigos]
+    invalidos = np.minimum.reduceat(valores, inicios) < 0
+    somas = np.add.reduceat(valores.astype(np.int64), inicios)
+
+    resultado = _reduzir_destino(somas).astype(np.int8)
+    resultado[invalidos | ausentes] = -1
+    return resultado
+
+
+def calcular_numeros_caminho_vida(datas):
+    """Número do Caminho de Vida de muitas datas (DD/MM/AAAA) de uma vez.
+
+    Datas se repetem muito em listas grandes (há só ~36 mil dias em um século), então cada data
+    distinta é calculada uma vez e o resultado é espalhado por consulta.
+
+    Returns:
+      Array int8 com o Número do Caminho de Vida de cada data, -1 para datas inválidas.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codigos, distintas = pd.factorize(pd.Series(datas, dtype=object))
+    numeros = [calcular_numero_caminho_vida(data) if isinstance(data, str) else None for data in distintas]
+    tabela = np.array([-1 if numero is None else numero for numero in numeros] + [-1], dtype=np.int8)
+    return tabela[codigos]  # Ausentes têm código -1, a última posição (inválida)
+
+
+def calcular_em_lote(entrada, saida, coluna_nome='nome', coluna_nascimento='nascimento',
+                     tamanho_bloco=100_000, **opcoes_csv):
+    """Calcula os números de um CSV de clientes, lendo e gravando em blocos.
+
+    O CSV de saída repete as colunas de entrada e acrescenta 'numero_destino' e
+    'numero_caminho_vida' (vazios quando o nome ou a data são inválidos).
+
+    Args:
+      entrada: caminho ou arquivo aberto do CSV com os nomes e datas de nascimento.
+      saida: caminho ou arquivo aberto para o CSV de resultado.
+      coluna_nome, coluna_nascimento: nomes das colunas de entrada.
+      tamanho_bloco: linhas processadas por vez; a memória usada não depende do tamanho do arquivo.
+      opcoes_csv: repassadas ao pandas.read_csv (ex.: sep=';', encoding='latin-1').
+
+    Returns:
+      Quantidade de linhas processadas.
+    """
+    import pandas as pd
+
+    total = 0
+    blocos = pd.read_csv(entrada, dtype=str, keep_default_na=False, chunksize=tamanho_bloco, **opcoes_csv)
+    for bloco in blocos:
+        destino = calcular_numeros_destino(bloco[coluna_nome].to_numpy())
+        caminho_vida = calcular_numeros_caminho_vida(bloco[coluna_nascimento].to_numpy())
+        bloco['numero_destino'] = pd.arrays.IntegerArray(destino, destino < 0)
+        bloco['numero_caminho_vida'] = pd.arrays.IntegerArray(caminho_vida, caminho_vida < 0)
+        bloco.to_csv(saida, sep=opcoes_csv.get('sep', ','), mode='w' if total == 0 else 'a', header=total == 0,
+                     index=False)
+        total += len(bloco)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calcula o Número de Destino e o Número do Caminho de Vida.")
+    parser.add_argument('--nome', help="nome completo (pedido no terminal se omitido)")
+    parser.add_argument('--nascimento', help="data de nascimento DD/MM/AAAA (pedida no terminal se omitida)")
+    parser.add_argument('--entrada', help="CSV com colunas de nome e nascimento para cálculo em lote")
+    parser.add_argument('--saida', help="CSV de resultado do cálculo em lote (padrão: saída padrão)")
+    parser.add_argument('--coluna-nome', default='nome')
+    parser.add_argument('--coluna-nascimento', default='nascimento')
+    parser.add_argument('--separador', default=',')
+    args = parser.parse_args(argv)
+
+    if args.entrada is not None:
+        import sys
+        saida = args.saida if args.saida is not None else sys.stdout
+        calcular_em_lote(args.entrada, saida, args.coluna_nome, args.coluna_nascimento, sep=args.separador)
+        return
+
+    nome = args.nome if args.nome is not None else input("Digite seu nome completo: ")
+    data_nascimento = args.nascimento if args.nascimento is not None else input(
+        "Digite sua data de nascimento no formato DD/MM/AAAA: ")
+
+    numero_destino = calcular_numero_destino(nome)
+    numero_caminho_vida = calcular_numero_caminho_vida(data_nascimento)
+
+    if numero_destino is not None and numero_caminho_vida is not None:
+        print(f"O Número de Destino para {nome} é: {numero_destino}")
+        print(f"O Número do Caminho de Vida para {data_nascimento} é: {numero_caminho_vida}")
+    elif numero_destino is None:
+        print("Nome inválido. Utilize apenas letras e espaços.")
+    elif numero_caminho_vida is None:
+        print("Data de nascimento inválida. Utilize o formato DD/MM/AAAA.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+import argparse
+import os
+import numpy as np
+from collections import defaultdict
+from functools import lru_cache
+from itertools import combinations
+from . import graficos
+from . import perfil
+from . import sorteios
+
+
+@perfil.cronometrado
+def carregar_dados(caminho_arquivo):
+    """Carrega os dados de um arquivo CSV.
+
+    Os sorteios vêm do cache binário de máscaras (sorteios.carregar_mascaras); o CSV só é
+    relido quando muda.
+    """
+    try:
+        mascaras = sorteios.carregar_mascaras(caminho_arquivo)
+        return sorteios.mascaras_para_dataframe(mascaras)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo não encontrado em {caminho_arquivo}")
+        return None
+
+
+@perfil.cronometrado
+def contar_repeticoes_por_defasagem(incidencia, defasagens):
+    """Conta, para cada defasagem k, quantas vezes cada número saiu no sorteio i e de novo no i + k.
+
+    Args:
+      incidencia: matriz booleana (sorteios x 25), ver sorteios.mascaras_para_incidencia.
+      defasagens: lista de defasagens (inteiros >= 1).
+
+    Returns:
+      Array int64 (len(defasagens) x 25); a coluna j corresponde ao número j + 1.
+    """
+    incidencia = np.asarray(incidencia, dtype=bool)
+    n_sorteios = incidencia.shape[0]
+    contagem = np.zeros((len(defasagens), sorteios.NUMEROS), dtype=np.int64)
+    for linha, k in enumerate(defasagens):
+        if k < 1:
+            raise ValueError(f"Defasagem inválida: {k}")
+        if k < n_sorteios:
+            contagem[linha] = np.count_nonzero(incidencia[:-k] & incidencia[k:], axis=0)
+    return contagem
+
+
+def _contagem_para_dict(contagem):
+    """Converte um vetor de 25 contagens no defaultdict {número: contagem} usado nos gráficos."""
+    return defaultdict(int, {num: int(valor) for num, valor in enumerate(contagem, start=1) if valor})
+
+
+@perfil.cronometrado
+def analisar_repeticoes(df, defasagens=(1, 2, 3)):
+    """Analisa padrões de repetição de números nos sorteios.
+
+    Além das chaves repeticao_*, 'repeticao_por_defasagem' traz a matriz
+    (len(defasagens) x 25) de contagens para as defasagens pedidas. `df` também pode ser
+    um tipos.Historico ou um array de máscaras.
+    """
+    incidencia = sorteios.mascaras_para_incidencia(sorteios.para_mascaras(df))
+    defasagens = list(defasagens)
+    fixas = [1, 2, 3]
+    contagem = contar_repeticoes_por_defasagem(incidencia, fixas + defasagens)
+
+    return {
+        'repeticao_imediata': _contagem_para_dict(contagem[0]),
+        'repeticao_2_sorteios': _contagem_para_dict(contagem[1]),
+        'repeticao_3_sorteios': _contagem_para_dict(contagem[2]),
+        'repeticao_geral': _contagem_para_dict(np.count_nonzero(incidencia, axis=0)),
+        'repeticao_por_defasagem': contagem[len(fixas):],
+    }
+
+
+def _janelas_posicionais(df, tamanho):
+    """Codifica as janelas de `tamanho` dezenas consecutivas de cada sorteio como máscaras de bits.
+
+    Retorna (janelas, validas): arrays (sorteios x janelas); janelas com células inválidas
+    ficam marcadas como False em `validas`.
+    """
+    bits = sorteios.matriz_para_bits(sorteios.para_matriz(df))
+    n_janelas = bits.shape[1] - tamanho + 1
+    janelas = bits[:, :n_janelas].copy()
+    for deslocamento in range(1, tamanho):
+        janelas |= bits[:, deslocamento:deslocamento + n_janelas]
+    return janelas, sorteios.contar_bits(janelas) == tamanho
+
+
+@lru_cache(maxsize=None)
+def _mascaras_combinacoes(tamanho):
+    """Máscaras de todas as combinações de `tamanho` números entre 1 e 25."""
+    return np.array([sorteios.codificar_sorteio(comb) for comb in combinations(range(1, 26), tamanho)],
+                    dtype=np.uint32)
+
+
+def _repeticoes_contiguas(df, tamanho):
+    """Máscaras distintas das janelas de cada sorteio que também aparecem como janela no sorteio
+    seguinte, com quantas vezes cada uma se repetiu."""
+    janelas, validas = _janelas_posicionais(df, tamanho)
+    if len(janelas) < 2:
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.int64)
+    # Chave (índice do par, máscara): a interseção entre sorteios consecutivos vira um único isin.
+    indices = np.arange(len(janelas) - 1, dtype=np.uint64)[:, None] << np.uint64(sorteios.NUMEROS)
+    chaves_atual = indices | janelas[:-1]
+    chaves_proximo = indices | janelas[1:]
+    encontradas = np.isin(chaves_atual, chaves_proximo[validas[1:]]) & validas[:-1]
+    return np.unique(janelas[:-1][encontradas], return_counts=True)
+
+
+def _repeticoes_combinacoes(df, tamanho, bloco=1 << 22):
+    """Combinações de `tamanho` números contidas em algum par de sorteios consecutivos (máscaras)
+    e em quantos pares cada uma aparece."""
+    mascaras = sorteios.para_mascaras(df)
+    comuns = mascaras[:-1] & mascaras[1:]
+    candidatas = _mascaras_combinacoes(tamanho)
+    contagem = np.zeros(len(candidatas), dtype=np.int64)
+    passo = max(1, bloco // len(candidatas))
+    for inicio in range(0, len(comuns), passo):
+        trecho = comuns[inicio:inicio + passo, None]
+        contagem += np.count_nonzero((trecho & candidatas) == candidatas, axis=0)
+    repetidas = contagem > 0
+    return candidatas[repetidas], contagem[repetidas]
+
+
+@perfil.cronometrado
+def analisar_sequencias_repetidas(df, tamanho=3, contiguas=True):
+    """ Analisa sequencias de números repetidas entre os sorteios
+
+    Com contiguas=True compara as janelas de `tamanho` dezenas consecutivas de cada sorteio
+    com as do sorteio seguinte; com contiguas=False considera todas as combinações de
+    `tamanho` números presentes nos dois sorteios. `df` também pode ser um tipos.Historico
+    ou um array de máscaras.
+    """
+    if contiguas:
+        mascaras, frequencias = _repeticoes_contiguas(df, tamanho)
+    else:
+        mascaras, frequencias = _repeticoes_combinacoes(df, tamanho)
+    sequencias = defaultdict(int)
+    for mascara, freq in zip(mascaras, frequencias):
+        sequencias[tuple(sorteios.decodificar_mascara(mascara))] = int(freq)
+    return sequencias
+
+
+def gerar_grafico_repeticao(repeticoes, titulo, tipo='bar', arquivo=None):
+    """Gera um gráfico de barras ou pizza para as repetições.
+
+    Com `arquivo` o gráfico é gravado (PNG/SVG pela extensão) em vez de aberto em uma janela.
+    """
+    numeros = list(repeticoes.keys())
+    frequencias = list(repeticoes.values())
+
+    figura, ax = graficos.nova_figura((12, 6), arquivo)
+    if tipo == 'bar':
+        ax.bar(numeros, frequencias, color='skyblue')
+    elif tipo == 'pie':
+        ax.pie(frequencias, labels=numeros, autopct='%1.1f%%', startangle=90)
+        ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+    ax.set_title(titulo)
+    ax.set_xlabel("Número")
+    ax.set_ylabel("Frequência")
+    ax.grid(axis='y')
+    figura.tight_layout()
+    graficos.finalizar(figura, arquivo)
+
+
+def gerar_grafico_sequencias(sequencias, titulo, top_n=40, arquivo=None):
+    """Gera um gráfico de barras para as sequências.
+
+    Com `arquivo` o gráfico é gravado (PNG/SVG pela extensão) em vez de aberto em uma janela.
+    """
+
+    sequencias_ordenadas = sorted(sequencias.items(), key=lambda item: item[1], reverse=False)[:top_n]
+    sequencias = [str(list(seq)) for seq, _ in sequencias_ordenadas]
+    frequencias = [freq for _, freq in sequencias_ordenadas]
+
+    figura, ax = graficos.nova_figura((12, 6), arquivo)
+    ax.bar(range(len(sequencias)), frequencias, color='lightcoral')
+    ax.set_xticks(range(len(sequencias)))
+    ax.set_xticklabels(sequencias, rotation=45, ha='right')
+    ax.set_title(titulo)
+    ax.set_xlabel("Sequência")
+    ax.set_ylabel("Frequência")
+    figura.tight_layout()
+    ax.grid(axis='y')
+    graficos.finalizar(figura, arquivo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analisa repetições e sequências do histórico.")
+    parser.add_argument('caminho_arquivo', nargs='?', default=sorteios.CAMINHO_PADRAO, help="CSV de resultados")
+    parser.add_argument('--graficos', metavar='DIRETORIO',
+                        help="grava os gráficos em PNG neste diretório, em paralelo, em vez de abrir janelas")
+    args = parser.parse_args(argv)
+    diretorio_graficos = args.graficos
+
+    try:
+        mascaras = sorteios.carregar_mascaras(args.caminho_arquivo)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo não encontrado em {args.caminho_arquivo}")
+        return
+
+    # As análises saem do cache em disco (memoria.CacheAnalises) quando o histórico não mudou
+    from . import memoria
+    cache = memoria.CacheAnalises()
+    repeticoes = cache.obter('repeticoes', mascaras)
+    analise_repeticao = {
+        'repeticao_imediata': _contagem_para_dict(repeticoes['defasagens'][0]),
+        'repeticao_2_sorteios': _contagem_para_dict(repeticoes['defasagens'][1]),
+        'repeticao_3_sorteios': _contagem_para_dict(repeticoes['defasagens'][2]),
+        'repeticao_geral': _contagem_para_dict(repeticoes['geral']),
+    }
+    print("Análise de Repetição de Números:\n")
+    print("Repetição Imediata:", analise_repeticao['repeticao_imediata'])
+    print("Repetição em 2 Sorteios:", analise_repeticao['repeticao_2_sorteios'])
+    print("Repetição em 3 Sorteios:", analise_repeticao['repeticao_3_sorteios'])
+    print("Repetição Geral:", analise_repeticao['repeticao_geral'])
+
+    from . import atraso
+    print("\nAtrasos (concursos sem sair):\n")
+    print(atraso.Atrasos(mascaras).tabela().to_string())
+
+    sequencias = cache.obter('sequencias', mascaras, tamanho=3, contiguas=True)
+    analise_sequencias = defaultdict(int, {tuple(sorteios.decodificar_mascara(mascara)): int(freq)
+                                           for mascara, freq in zip(sequencias['mascaras'], sequencias['contagens'])})
+    print("\nAnálise de Sequências Repetidas (3 Números):\n")
+    for seq, freq in sorted(analise_sequencias.items(), key=lambda item: item[1], reverse=False):
+        print(f"Sequência:{freq} {list(seq)} - Frequência: {freq}")
+
+    # Gera gráficos: (função, argumentos, nome do arquivo no modo sem janela)
+    tarefas = [
+        (gerar_grafico_repeticao, (analise_repeticao['repeticao_imediata'], "Repetição Imediata (Barras)"),
+         'repeticao_imediata'),
+        (gerar_grafico_repeticao, (analise_repeticao['repeticao_2_sorteios'], "Repetição em 2 Sorteios (Barras)"),
+         'repeticao_2_sorteios'),
+        (gerar_grafico_repeticao, (analise_repeticao['repeticao_3_sorteios'], "Repetição em 3 Sorteios (Barras)"),
+         'repeticao_3_sorteios'),
+        (gerar_grafico_repeticao, (analise_repeticao['repeticao_geral'], "Repetição Geral (Barras)"),
+         'repeticao_geral'),
+        (gerar_grafico_sequencias, (analise_sequencias, "Sequências Mais Repetidas", 153), 'sequencias'),
+    ]
+    if diretorio_graficos is None:
+        for funcao, args, _ in tarefas:
+            funcao(*args)
+    else:
+        os.makedirs(diretorio_graficos, exist_ok=True)
+        arquivos = graficos.renderizar_em_paralelo(
+            [(funcao, args, {'arquivo': os.path.join(diretorio_graficos, f'{nome}.png')})
+             for funcao, args, nome in tarefas])
+        print("\nGráficos gravados:", *arquivos, sep="\n")
+
+
+if __name__ == "__main__":
+    main()
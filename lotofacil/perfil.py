@@ -0,0 +1,66 @@
+import functools
+import json
+import os
+import time
+from collections import defaultdict
+
+# Instrumentação opcional: desligada por padrão, ligada com ativar() ou LOTOFACIL_PERFIL=1.
+_ATIVO = os.environ.get('LOTOFACIL_PERFIL') == '1'
+_TEMPOS = defaultdict(lambda: {'chamadas': 0, 'segundos': 0.0})
+_CONTADORES = defaultdict(int)
+
+
+def ativar(ligado=True):
+    """Liga ou desliga a coleta de tempos e contadores."""
+    global _ATIVO
+    _ATIVO = ligado
+
+
+def ativo():
+    """Indica se a coleta está ligada."""
+    return _ATIVO
+
+
+def zerar():
+    """Descarta tempos e contadores coletados até agora."""
+    _TEMPOS.clear()
+    _CONTADORES.clear()
+
+
+def cronometrado(funcao):
+    """Decorador: com a coleta ligada, acumula chamadas e tempo total da função."""
+    nome = f'{funcao.__module__}.{funcao.__qualname__}'
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        if not _ATIVO:
+            return funcao(*args, **kwargs)
+        inicio = time.perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            registro = _TEMPOS[nome]
+            registro['chamadas'] += 1
+            registro['segundos'] += time.perf_counter() - inicio
+
+    return envoltorio
+
+
+def contar(nome, quantidade=1):
+    """Incrementa um contador (por exemplo, iterações de um laço) se a coleta estiver ligada."""
+    if _ATIVO:
+        _CONTADORES[nome] += quantidade
+
+
+def relatorio():
+    """Tempos e contadores coletados, em um dicionário serializável."""
+    return {
+        'tempos': {nome: dict(registro) for nome, registro in sorted(_TEMPOS.items())},
+        'contadores': dict(sorted(_CONTADORES.items())),
+    }
+
+
+def salvar_json(caminho):
+    """Grava o relatório em JSON."""
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(relatorio(), arquivo, indent=2, ensure_ascii=False)
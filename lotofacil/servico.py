@@ -0,0 +1,503 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from urllib.parse import parse_qsl, urlsplit
+import numpy as np
+from . import backtest
+from . import busca
+from . import fechamento
+from . import jogo
+from . import memoria
+from . import sorteios
+from .atraso import Atrasos
+from .coocorrencia import Coocorrencia
+from .estatisticas import serie_frequencia
+
+# Mesmas estratégias do backtest, mais as de coocorrência e atraso; todas devolvem máscaras.
+# Cada uma recebe o histórico, a quantidade, o gerador e os parâmetros de PARAMETROS (as
+# famílias com parâmetros são as de busca.FAMILIAS).
+ESTRATEGIAS = {
+    'mais_frequentes': busca.FAMILIAS['mais_frequentes'],
+    'menos_frequentes': busca.FAMILIAS['menos_frequentes'],
+    'mix_frequencias': busca.FAMILIAS['mix_frequencias'],
+    'por_soma': busca.FAMILIAS['por_soma'],
+    'mais_pares': backtest.ESTRATEGIAS['mais_pares'],
+    'mais_impares': backtest.ESTRATEGIAS['mais_impares'],
+    'por_distribuicao': busca.FAMILIAS['por_distribuicao'],
+    'por_coocorrencia': lambda h, n, g, fixos: jogo.gerar_lote_por_coocorrencia(
+        n, g, h['coocorrencia'], list(fixos) or None, formato='mascaras'),
+    'por_atraso': lambda h, n, g, expoente: jogo.gerar_lote_por_pesos(n, g, h['atrasos'].pesos(expoente),
+                                                                        formato='mascaras'),
+}
+
+# Parâmetros aceitos por estratégia e seus valores padrão (os do backtest); o tipo do padrão
+# define a conversão dos valores recebidos na requisição.
+PARAMETROS = {
+    'mais_frequentes': {'tamanho_grupo': 15},
+    'menos_frequentes': {},
+    'mix_frequencias': {'quantidade_mais': 7, 'quantidade_menos': 8},
+    'por_soma': {'faixa_soma_min': backtest.FAIXA_SOMA[0], 'faixa_soma_max': backtest.FAIXA_SOMA[1]},
+    'mais_pares': {},
+    'mais_impares': {},
+    'por_distribuicao': {'linhas_escolhidas': tuple(backtest.LINHAS_ESCOLHIDAS.items()),
+                         'colunas_escolhidas': tuple(backtest.COLUNAS_ESCOLHIDAS)},
+    'por_coocorrencia': {'fixos': ()},
+    'por_atraso': {'expoente': 1.0},
+}
+
+QUANTIDADE_MAXIMA = 10_000  # apostas por requisição
+# Pares aposta-sorteio aceitos em /fechamento_garantido (ver fechamento.gerar_fechamento_garantido):
+# até 22 dezenas com garantia 14, alguns segundos e menos de 200 MB por pedido.
+LIMITE_FECHAMENTO = 20_000_000
+FILA_CONEXOES = 1024  # conexões pendentes aceitas pelo socket (o padrão, 100, estoura com muitos clientes)
+
+_STATUS = {200: '200 OK', 400: '400 Bad Request', 404: '404 Not Found', 500: '500 Internal Server Error'}
+
+# Estado de cada processo de trabalho, montado uma única vez por _inicializar_processo.
+_CONTEXTO = {}
+
+
+def preparar_historico(mascaras):
+    """Estatísticas do histórico usadas pelas estratégias (frequência, coocorrência e atrasos)."""
+    contagem = memoria.CacheAnalises().obter('frequencia', mascaras)['contagem']
+    return {'frequencia': serie_frequencia(contagem), 'coocorrencia': Coocorrencia(mascaras),
+            'atrasos': Atrasos(mascaras)}
+
+
+def _inicializar_processo(historico):
+    """Guarda, no processo de trabalho, o histórico preparado e um gerador próprio.
+
+    Cada estratégia gera uma aposta de aquecimento, para que os primeiros pedidos não paguem
+    importações e tabelas montadas no primeiro uso.
+    """
+    _CONTEXTO.update(historico=historico, gerador=np.random.default_rng())
+    for estrategia, padroes in PARAMETROS.items():
+        _gerar_lote(estrategia, tuple(padroes.items()), 1)
+
+
+def _gerar_lote(estrategia, parametros, quantidade):
+    """Gera `quantidade` apostas (máscaras) de uma estratégia no processo de trabalho."""
+    return ESTRATEGIAS[estrategia](_CONTEXTO['historico'], quantidade, _CONTEXTO['gerador'], **dict(parametros))
+
+
+def _converter(valor, padrao):
+    """Converte um parâmetro recebido (JSON ou query string) para o tipo do valor padrão.
+
+    Tuplas aceitam listas JSON ou texto separado por vírgulas; pares (linha, quantidade)
+    aceitam [[0, 2], ...], {"0": 2, ...} ou '0:2,2:3'.
+    """
+    if not isinstance(padrao, tuple):
+        return type(padrao)(valor)
+    if isinstance(valor, str):
+        valor = [parte.split(':') if ':' in parte else parte for parte in valor.split(',') if parte.strip()]
+    elif isinstance(valor, dict):
+        valor = valor.items()
+    return tuple(tuple(int(item) for item in elemento) if isinstance(elemento, (list, tuple)) else int(elemento)
+                 for elemento in valor)
+
+
+def _validar(parametros):
+    """Confere as faixas dos parâmetros já convertidos; ValueError (400) se algum não servir.
+
+    Os geradores não conferem tudo isso: números fora de 1 a 25 viram índices negativos e
+    linhas ou colunas inexistentes são ignoradas em silêncio.
+    """
+    def exigir(condicao, mensagem):
+        if not condicao:
+            raise ValueError(mensagem)
+
+    def inteiros(valores, minimo, maximo):
+        return all(isinstance(valor, int) and minimo <= valor <= maximo for valor in valores)
+
+    if 'tamanho_grupo' in parametros:
+        exigir(15 <= parametros['tamanho_grupo'] <= 25, "tamanho_grupo deve ficar entre 15 e 25.")
+    if 'quantidade_mais' in parametros:
+        mais, menos = parametros['quantidade_mais'], parametros['quantidade_menos']
+        exigir(0 <= mais <= 25 and 0 <= menos <= 25, "quantidade_mais e quantidade_menos devem ficar entre 0 e 25.")
+        exigir(mais + menos >= 15, "quantidade_mais + quantidade_menos deve ser ao menos 15.")
+    if 'linhas_escolhidas' in parametros:
+        linhas = parametros['linhas_escolhidas']
+        exigir(all(isinstance(par, tuple) and len(par) == 2 for par in linhas),
+               "linhas_escolhidas deve ter pares (linha, quantidade).")
+        exigir(inteiros([linha for linha, _ in linhas], 0, 4) and len({linha for linha, _ in linhas}) == len(linhas),
+               "As linhas devem ser distintas, entre 0 e 4.")
+        exigir(inteiros([quantidade for _, quantidade in linhas], 0, 5), "Cada linha aceita de 0 a 5 números.")
+        exigir(sum(quantidade for _, quantidade in linhas) <= sorteios.DEZENAS_POR_SORTEIO,
+               "As quantidades por linha devem somar no máximo 15.")
+    if 'colunas_escolhidas' in parametros:
+        exigir(inteiros(parametros['colunas_escolhidas'], 0, 9), "As colunas devem ficar entre 0 e 9.")
+    if 'fixos' in parametros:
+        fixos = parametros['fixos']
+        exigir(inteiros(fixos, 1, sorteios.NUMEROS), "Os números fixos devem ficar entre 1 e 25.")
+        exigir(len(set(fixos)) <= sorteios.DEZENAS_POR_SORTEIO, "No máximo 15 números fixos.")
+    if 'expoente' in parametros:
+        exigir(math.isfinite(parametros['expoente']), "expoente deve ser um número finito.")
+
+
+def normalizar_parametros(estrategia, parametros):
+    """Parâmetros completos (padrões + recebidos) da estratégia como tupla ordenada e hashable.
+
+    Pedidos com os mesmos parâmetros normalizados são agrupados no mesmo lote.
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia desconhecida: {estrategia}")
+    padroes = PARAMETROS[estrategia]
+    desconhecidos = set(parametros) - set(padroes)
+    if desconhecidos:
+        raise ValueError(f"Parâmetros desconhecidos para {estrategia}: {sorted(desconhecidos)}")
+    normalizados = dict(padroes)
+    for nome, valor in parametros.items():
+        try:
+            normalizados[nome] = _converter(valor, padroes[nome])
+        except (TypeError, ValueError):
+            raise ValueError(f"Valor inválido para {nome}: {valor!r}") from None
+    _validar(normalizados)
+    return tuple(sorted(normalizados.items()))
+
+
+def _fechamento(dezenas):
+    """Fechamento simples de jogo.fechamento.main: 10 dezenas fixas e grupos A, B e C sorteados."""
+    if len(dezenas) != 10 or len(set(dezenas)) != 10 or any(num < 1 or num > 25 for num in dezenas):
+        raise ValueError("Informe 10 dezenas distintas entre 1 e 25.")
+    restantes = [num for num in range(1, 26) if num not in dezenas]
+    np.random.default_rng().shuffle(restantes)
+    return fechamento.gerar_fechamento(list(dezenas), restantes[:5], restantes[5:10], restantes[10:15])
+
+
+class ServicoApostas:
+    """Serviço asyncio de geração de apostas com o histórico residente em memória.
+
+    Pedidos simultâneos da mesma estratégia com os mesmos parâmetros são agrupados: o primeiro
+    pedido agenda um despacho após `espera` segundos e todos os que chegarem até lá viram uma
+    única chamada gerar_lote_*
+    (de até `lote_maximo` apostas), executada em um pool de processos. Com processos=0 a geração
+    roda no próprio processo (útil em testes).
+    """
+
+    def __init__(self, mascaras, processos=None, espera=0.002, lote_maximo=4096):
+        self.historico = preparar_historico(np.asarray(mascaras, dtype=np.uint32))
+        self.processos = processos
+        self.espera = espera
+        self.lote_maximo = lote_maximo
+        self._executor = None
+        self._filas = defaultdict(list)
+        self._tarefas = set()  # Lotes em andamento (o loop só guarda referências fracas às tarefas)
+        self.estatisticas = defaultdict(int)
+
+    def iniciar(self):
+        """Sobe o pool de processos (cada processo recebe o histórico preparado uma única vez)."""
+        if self.processos == 0:
+            _inicializar_processo(self.historico)
+        elif self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processos, initializer=_inicializar_processo,
+                                                 initargs=(self.historico,))
+            # Força a criação de todos os processos antes do primeiro pedido
+            for futuro in [self._executor.submit(time.sleep, 0.05) for _ in range(self.processos or os.cpu_count())]:
+                futuro.result()
+
+    def encerrar(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def _executar(self, funcao, *args):
+        if self._executor is None:
+            return funcao(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, funcao, *args)
+
+    async def gerar(self, estrategia, quantidade=1, **parametros):
+        """Gera `quantidade` apostas da estratégia, como listas ordenadas de 15 números.
+
+        Os `parametros` (ver PARAMETROS) substituem os padrões da estratégia; se não permitirem
+        completar 15 dezenas (ex.: por_distribuicao), a aposta traz só os números escolhidos.
+        """
+        chave = (estrategia, normalizar_parametros(estrategia, parametros))
+        if not 1 <= quantidade <= QUANTIDADE_MAXIMA:
+            raise ValueError(f"A quantidade deve ficar entre 1 e {QUANTIDADE_MAXIMA}.")
+        futuro = asyncio.get_running_loop().create_future()
+        fila = self._filas[chave]
+        fila.append((quantidade, futuro))
+        if len(fila) == 1:
+            asyncio.get_running_loop().call_later(self.espera, self._despachar, chave)
+        return await futuro
+
+    def _despachar(self, chave):
+        """Divide os pedidos acumulados de (estratégia, parâmetros) em lotes e dispara a geração de cada um."""
+        pedidos = self._filas.pop(chave, [])
+        lote, total = [], 0
+        for pedido in pedidos:
+            if lote and total + pedido[0] > self.lote_maximo:
+                self._disparar(self._gerar_lote(chave, lote, total))
+                lote, total = [], 0
+            lote.append(pedido)
+            total += pedido[0]
+        if lote:
+            self._disparar(self._gerar_lote(chave, lote, total))
+
+    def _disparar(self, corrotina):
+        tarefa = asyncio.ensure_future(corrotina)
+        self._tarefas.add(tarefa)
+        tarefa.add_done_callback(self._tarefas.discard)
+
+    async def _gerar_lote(self, chave, pedidos, total):
+        self.estatisticas['lotes'] += 1
+        self.estatisticas['apostas'] += total
+        try:
+            mascaras = await self._executar(_gerar_lote, *chave, total)
+            if (sorteios.contar_bits(mascaras) > sorteios.DEZENAS_POR_SORTEIO).any():
+                # mascaras_para_matriz truncaria essas apostas em 15 números
+                raise ValueError("Os parâmetros geraram apostas com mais de 15 números.")
+            apostas = sorteios.mascaras_para_matriz(mascaras).tolist()
+            if (sorteios.contar_bits(mascaras) != sorteios.DEZENAS_POR_SORTEIO).any():
+                # Parâmetros que não completam 15 dezenas: devolve só os números escolhidos
+                apostas = [[num for num in aposta if num] for aposta in apostas]
+        except Exception as erro:
+            for _, futuro in pedidos:
+                if not futuro.done():
+                    futuro.set_exception(erro)
+            return
+        inicio = 0
+        for quantidade, futuro in pedidos:
+            if not futuro.done():
+                futuro.set_result(apostas[inicio:inicio + quantidade])
+            inicio += quantidade
+
+    async def fechamento(self, dezenas):
+        """Fechamento simples (gerar_fechamento) a partir de 10 dezenas."""
+        return _fechamento(dezenas)
+
+    async def fechamento_garantido(self, dezenas, garantia=14):
+        """Fechamento com garantia (gerar_fechamento_garantido), calculado no pool de processos.
+
+        Combinações de dezenas e garantia acima de LIMITE_FECHAMENTO são recusadas (ValueError)
+        antes do cálculo. Sem pool (processos=0) o cálculo roda em uma thread, sem travar o loop.
+        """
+        gerar = partial(fechamento.gerar_fechamento_garantido, limite=LIMITE_FECHAMENTO)
+        if self._executor is None:
+            return await asyncio.get_running_loop().run_in_executor(None, gerar, list(dezenas), garantia)
+        return await self._executar(gerar, list(dezenas), garantia)
+
+    async def responder(self, metodo, alvo, corpo=b''):
+        """Atende uma requisição HTTP já lida e devolve (status, objeto JSON)."""
+        url = urlsplit(alvo)
+        parametros = dict(parse_qsl(url.query))
+        try:
+            if corpo:
+                parametros.update(json.loads(corpo))
+            if url.path == '/estrategias':
+                return 200, {'estrategias': sorted(ESTRATEGIAS), 'parametros': PARAMETROS}
+            if url.path == '/gerar':
+                estrategia = parametros.pop('estrategia', '')
+                quantidade = int(parametros.pop('quantidade', 1))
+                return 200, {'apostas': await self.gerar(estrategia, quantidade, **parametros)}
+            if url.path == '/fechamento':
+                return 200, {'apostas': await self.fechamento(_lista_inteiros(parametros.get('dezenas')))}
+            if url.path == '/fechamento_garantido':
+                apostas = await self.fechamento_garantido(_lista_inteiros(parametros.get('dezenas')),
+                                                          int(parametros.get('garantia', 14)))
+                return 200, {'apostas': apostas}
+            if url.path == '/estatisticas':
+                return 200, dict(self.estatisticas)
+            return 404, {'erro': f"Caminho desconhecido: {url.path}"}
+        except (ValueError, TypeError) as erro:
+            return 400, {'erro': str(erro)}
+
+    async def _ler_requisicao(self, leitor):
+        """Lê linha de requisição, cabeçalhos e corpo; None se a conexão terminou.
+
+        Levanta ValueError se a requisição estiver malformada.
+        """
+        linha = await leitor.readline()
+        if not linha.strip():
+            return None
+        partes = linha.decode('latin-1').split()
+        if len(partes) != 3:
+            raise ValueError(f"Linha de requisição inválida: {linha[:80]!r}")
+        metodo, alvo, _ = partes
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b'\r\n', b'\n', b''):
+                break
+            nome, separador, valor = linha.decode('latin-1').partition(':')
+            if not separador or not nome.strip():
+                raise ValueError(f"Cabeçalho inválido: {linha[:80]!r}")
+            cabecalhos[nome.strip().lower()] = valor.strip()
+        tamanho = cabecalhos.get('content-length', '0')
+        if not tamanho.isdigit():
+            raise ValueError(f"Content-Length inválido: {tamanho!r}")
+        return metodo, alvo, cabecalhos, await leitor.readexactly(int(tamanho))
+
+    async def _atender(self, leitor, escritor):
+        """Laço de uma conexão HTTP/1.1 (keep-alive): lê requisições e responde em JSON.
+
+        Requisições malformadas recebem 400 e encerram a conexão.
+        """
+        try:
+            while True:
+                try:
+                    requisicao = await self._ler_requisicao(leitor)
+                except ValueError as erro:  # Também cobre linhas acima do limite do StreamReader
+                    await _escrever_resposta(escritor, 400, {'erro': f"Requisição malformada: {erro}"})
+                    break
+                if requisicao is None:
+                    break
+                metodo, alvo, cabecalhos, corpo = requisicao
+                try:
+                    status, resposta = await self.responder(metodo, alvo, corpo)
+                except Exception as erro:
+                    status, resposta = 500, {'erro': repr(erro)}
+                await _escrever_resposta(escritor, status, resposta)
+                if cabecalhos.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def servir(self, host='127.0.0.1', porta=8765, caminho_unix=None):
+        """Abre o servidor HTTP (TCP ou, com `caminho_unix`, socket Unix) e devolve o asyncio.Server."""
+        self.iniciar()
+        if caminho_unix is not None:
+            return await asyncio.start_unix_server(self._atender, path=caminho_unix, backlog=FILA_CONEXOES)
+        return await asyncio.start_server(self._atender, host, porta, backlog=FILA_CONEXOES)
+
+
+async def _escrever_resposta(escritor, status, resposta):
+    dados = json.dumps(resposta).encode()
+    escritor.write(f"HTTP/1.1 {_STATUS[status]}\r\nContent-Type: application/json\r\n"
+                   f"Content-Length: {len(dados)}\r\n\r\n".encode() + dados)
+    await escritor.drain()
+
+
+def _lista_inteiros(valor):
+    """Aceita [1, 2, ...] (JSON) ou '1,2,...' (query string)."""
+    if isinstance(valor, str):
+        valor = valor.split(',')
+    return [int(num) for num in valor or []]
+
+
+class Cliente:
+    """Cliente HTTP mínimo (uma conexão keep-alive) para o ServicoApostas."""
+
+    def __init__(self, host='127.0.0.1', porta=8765, caminho_unix=None):
+        self.host, self.porta, self.caminho_unix = host, porta, caminho_unix
+        self._leitor = self._escritor = None
+
+    async def conectar(self):
+        if self.caminho_unix is not None:
+            self._leitor, self._escritor = await asyncio.open_unix_connection(self.caminho_unix)
+        else:
+            self._leitor, self._escritor = await asyncio.open_connection(self.host, self.porta)
+
+    async def fechar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+            await self._escritor.wait_closed()
+            self._escritor = None
+
+    async def requisitar(self, metodo, alvo, corpo=None):
+        """Envia uma requisição e devolve (código de status, objeto JSON da resposta)."""
+        if self._escritor is None:
+            await self.conectar()
+        dados = b'' if corpo is None else json.dumps(corpo).encode()
+        self._escritor.write(f"{metodo} {alvo} HTTP/1.1\r\nHost: {self.host}\r\n"
+                             f"Content-Length: {len(dados)}\r\n\r\n".encode() + dados)
+        await self._escritor.drain()
+        status = int((await self._leitor.readline()).split()[1])
+        tamanho = 0
+        while True:
+            linha = await self._leitor.readline()
+            if linha in (b'\r\n', b'\n', b''):
+                break
+            nome, _, valor = linha.decode('latin-1').partition(':')
+            if nome.strip().lower() == 'content-length':
+                tamanho = int(valor)
+        return status, json.loads(await self._leitor.readexactly(tamanho))
+
+    async def gerar(self, estrategia, quantidade=1, **parametros):
+        if parametros:
+            status, resposta = await self.requisitar('POST', '/gerar', dict(parametros, estrategia=estrategia,
+                                                                            quantidade=quantidade))
+        else:
+            status, resposta = await self.requisitar('GET', f'/gerar?estrategia={estrategia}&quantidade={quantidade}')
+        if status != 200:
+            raise ValueError(resposta.get('erro'))
+        return resposta['apostas']
+
+
+async def testar_carga(requisicoes=10_000, conexoes=64, estrategias=None, quantidade=1, **endereco):
+    """Dispara requisições de geração em várias conexões simultâneas e mede vazão e latência.
+
+    Returns:
+      Dicionário com requisições por segundo e latências (ms) p50, p99 e máxima.
+    """
+    estrategias = list(estrategias or ESTRATEGIAS)
+    latencias = []
+
+    async def trabalhar(indice):
+        cliente = Cliente(**endereco)
+        try:
+            for numero in range(indice, requisicoes, conexoes):
+                inicio = time.perf_counter()
+                await cliente.gerar(estrategias[numero % len(estrategias)], quantidade)
+                latencias.append(time.perf_counter() - inicio)
+        finally:
+            await cliente.fechar()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabalhar(indice) for indice in range(conexoes)))
+    duracao = time.perf_counter() - inicio
+    p50, p99 = np.percentile(latencias, [50, 99]) * 1000
+    return {'requisicoes_por_segundo': len(latencias) / duracao, 'p50_ms': float(p50), 'p99_ms': float(p99),
+            'max_ms': max(latencias) * 1000}
+
+
+async def _servir_para_sempre(servico, **endereco):
+    servidor = await servico.servir(**endereco)
+    print("Servindo em", ', '.join(str(soquete.getsockname()) for soquete in servidor.sockets))
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço HTTP de geração de apostas.")
+    parser.add_argument('caminho_arquivo', nargs='?', default=sorteios.CAMINHO_PADRAO, help="CSV de resultados")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--unix', help="caminho de um socket Unix (em vez de TCP)")
+    parser.add_argument('--processos', type=int, help="tamanho do pool de processos (0 = no próprio processo)")
+    parser.add_argument('--espera-ms', type=float, default=2.0, help="janela de agrupamento dos pedidos")
+    parser.add_argument('--testar-carga', type=int, metavar='REQUISICOES',
+                        help="em vez de servir, dispara requisições contra um serviço já em execução")
+    parser.add_argument('--conexoes', type=int, default=64)
+    args = parser.parse_args(argv)
+    endereco = {'caminho_unix': args.unix} if args.unix else {'host': args.host, 'porta': args.porta}
+
+    if args.testar_carga:
+        resultado = asyncio.run(testar_carga(args.testar_carga, args.conexoes, **endereco))
+        print(json.dumps(resultado, indent=2))
+        return
+
+    try:
+        mascaras = sorteios.carregar_mascaras(args.caminho_arquivo)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo não encontrado em {args.caminho_arquivo}")
+        return
+    servico = ServicoApostas(mascaras, processos=args.processos, espera=args.espera_ms / 1000)
+    try:
+        asyncio.run(_servir_para_sempre(servico, **endereco))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servico.encerrar()
+
+
+if __name__ == "__main__":
+    main()
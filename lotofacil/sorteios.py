@@ -0,0 +1,383 @@
+import os
+import numpy as np
+from . import perfil
+
+NUMEROS = 25
+DEZENAS_POR_SORTEIO = 15
+
+# CSV de resultados usado pelas ferramentas de linha de comando quando nenhum caminho é informado.
+CAMINHO_PADRAO = '/home/nelson/pagina/lotofacil.csv'
+
+# Cabeçalho do arquivo de cache: identificador, tamanho e mtime do CSV de origem e quantidade de sorteios.
+_IDENTIFICADOR = b'LFMASK01'
+_CABECALHO = np.dtype([
+    ('identificador', 'S8'),
+    ('tamanho', '<i8'),
+    ('mtime', '<i8'),
+    ('quantidade', '<i8'),
+])
+_BITS = np.uint32(1) << np.arange(NUMEROS, dtype=np.uint32)
+
+
+def codificar_sorteio(numeros):
+    """Codifica uma lista de números (1 a 25) em uma máscara de 25 bits (número n -> bit n-1)."""
+    mascara = 0
+    for num in numeros:
+        mascara |= 1 << (int(num) - 1)
+    return mascara
+
+
+def decodificar_mascara(mascara):
+    """Converte uma máscara de 25 bits na lista ordenada dos números sorteados."""
+    mascara = int(mascara)
+    return [num for num in range(1, NUMEROS + 1) if mascara >> (num - 1) & 1]
+
+
+def contar_bits(valores):
+    """Conta os bits ligados (popcount) de cada elemento de um array de inteiros."""
+    valores = np.asarray(valores)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(valores)
+    valores = valores.astype(np.uint32)
+    valores = valores - ((valores >> 1) & 0x55555555)
+    valores = (valores & 0x33333333) + ((valores >> 2) & 0x33333333)
+    valores = (valores + (valores >> 4)) & 0x0F0F0F0F
+    return ((valores * np.uint32(0x01010101)) >> 24).astype(np.uint8)
+
+
+def combinacoes_mascaras(n_bits, quantidade, bloco=1 << 20):
+    """Todas as máscaras de `n_bits` bits com exatamente `quantidade` bits ligados, em ordem crescente."""
+    partes = []
+    for inicio in range(0, 1 << n_bits, bloco):
+        valores = np.arange(inicio, min(inicio + bloco, 1 << n_bits), dtype=np.uint32)
+        partes.append(valores[contar_bits(valores) == quantidade])
+    return np.concatenate(partes)
+
+
+def para_mascaras(apostas):
+    """Normaliza apostas para um array uint32 de máscaras.
+
+    Aceita uma aposta (lista de números ou tipos.Aposta), uma lista de apostas, uma matriz
+    (apostas x 15), um array de máscaras ou uma coleção de tipos (LoteApostas, Historico).
+    Máscaras de 15 bits são sempre maiores que 25, então uma lista de números nunca é
+    confundida com uma lista de máscaras.
+    """
+    if hasattr(apostas, 'mascara'):
+        return np.array([apostas.mascara], dtype=np.uint32)
+    if isinstance(apostas, (list, tuple)) and apostas and hasattr(apostas[0], 'mascara'):
+        return np.fromiter((aposta.mascara for aposta in apostas), dtype=np.uint32, count=len(apostas))
+    valores = np.asarray(apostas)
+    if valores.ndim == 2:
+        return matriz_para_mascaras(valores)
+    if valores.ndim == 1 and len(valores) and valores.max() <= NUMEROS:
+        return np.array([codificar_sorteio(valores)], dtype=np.uint32)
+    return valores.astype(np.uint32).reshape(-1)
+
+
+def para_matriz(dados):
+    """Matriz de dezenas (sorteios x 15) a partir de um DataFrame/matriz ou de máscaras.
+
+    DataFrames e matrizes são devolvidos como estão; máscaras (array 1D ou tipos.Historico)
+    viram a matriz ordenada de mascaras_para_matriz.
+    """
+    valores = np.asarray(dados)
+    return mascaras_para_matriz(valores) if valores.ndim == 1 else dados
+
+
+def validar_matriz(matriz):
+    """Máscara booleana das células válidas (inteiros de 1 a 25) de uma matriz de dezenas."""
+    matriz = np.asarray(matriz)
+    if matriz.dtype.kind not in 'iuf':
+        matriz = matriz.astype(np.float64)
+    validos = (matriz >= 1) & (matriz <= NUMEROS)  # NaN falha nas duas comparações
+    if matriz.dtype.kind == 'f':
+        validos &= matriz == np.floor(matriz)
+    return validos
+
+
+def matriz_para_bits(matriz):
+    """Converte cada célula de uma matriz de dezenas no seu bit (uint32); células inválidas viram 0."""
+    validos = validar_matriz(matriz)
+    posicoes = np.where(validos, matriz, 1).astype(np.uint32) - 1
+    return np.where(validos, np.uint32(1) << posicoes, np.uint32(0))
+
+
+def matriz_para_mascaras(matriz):
+    """Codifica uma matriz (sorteios x dezenas) em um array uint32 de máscaras.
+
+    Células fora de 1..25, não inteiras ou NaN são ignoradas; o sorteio correspondente
+    fica com menos de 15 bits ligados.
+    """
+    return np.bitwise_or.reduce(matriz_para_bits(matriz), axis=1).astype(np.uint32)
+
+
+def incidencia_para_mascaras(incidencia):
+    """Codifica uma matriz booleana de incidência (linhas x 25) em um array uint32 de máscaras."""
+    incidencia = np.asarray(incidencia, dtype=bool)
+    return np.bitwise_or.reduce(np.where(incidencia, _BITS, np.uint32(0)), axis=1).astype(np.uint32)
+
+
+def mascaras_para_incidencia(mascaras):
+    """Converte as máscaras em uma matriz booleana de incidência (sorteios x 25)."""
+    mascaras = np.asarray(mascaras, dtype=np.uint32)
+    return (mascaras[:, None] & _BITS) != 0
+
+
+def incidencia_para_matriz(incidencia):
+    """Converte uma matriz de incidência com exatamente 15 números por linha em matriz uint8 (linhas x 15)."""
+    incidencia = np.asarray(incidencia, dtype=bool)
+    colunas = np.nonzero(incidencia)[1]
+    return (colunas + 1).astype(np.uint8).reshape(-1, DEZENAS_POR_SORTEIO)
+
+
+def linhas_colunas(contagem):
+    """Histogramas por linha ((num - 1) // 5) e coluna ((num - 1) % 10) do volante.
+
+    Args:
+      contagem: array (sorteios x 25) com quantas vezes cada número aparece (incidência).
+
+    Returns:
+      Tupla (linhas, colunas) de arrays (sorteios x 5) e (sorteios x 10), com o mesmo tipo de
+      `contagem` (uint8 se ela for booleana).
+    """
+    contagem = np.asarray(contagem)
+    if contagem.dtype == bool:
+        contagem = contagem.astype(np.uint8)
+    # Linha: blocos de 5 números consecutivos
+    linhas = contagem.reshape(-1, 5, 5).sum(axis=2, dtype=contagem.dtype)
+    # Coluna: 1-10 e 11-20 ocupam as 10 colunas, 21-25 voltam às colunas 0 a 4
+    colunas = contagem[:, :20].reshape(-1, 2, 10).sum(axis=1, dtype=contagem.dtype)
+    colunas[:, :5] += contagem[:, 20:]
+    return linhas, colunas
+
+
+def mascaras_para_matriz(mascaras):
+    """Converte as máscaras em uma matriz uint8 (sorteios x 15) com os números em ordem crescente.
+
+    Sorteios incompletos são preenchidos com 0 nas últimas posições.
+    """
+    incidencia = mascaras_para_incidencia(mascaras)
+    numeros = np.where(incidencia, np.arange(1, NUMEROS + 1, dtype=np.uint8), np.uint8(255))
+    numeros = np.sort(numeros, axis=1)[:, :DEZENAS_POR_SORTEIO]
+    numeros[numeros == 255] = 0
+    return numeros
+
+
+def mascaras_para_dataframe(mascaras):
+    """Monta o DataFrame de dezenas (uma coluna por bola) usado pelas análises."""
+    import pandas as pd
+
+    matriz = mascaras_para_matriz(mascaras)
+    colunas = [f'Bola{i}' for i in range(1, DEZENAS_POR_SORTEIO + 1)]
+    df = pd.DataFrame(matriz.astype(np.int64), columns=colunas)
+    if (matriz == 0).any():
+        # Mantém o comportamento anterior: células inválidas viram NaN.
+        df = df.where(df > 0)
+    return df
+
+
+def motivos_rejeicao(concursos, matriz, ultimo_concurso=-np.inf):
+    """Valida um bloco de linhas do CSV e devolve o motivo de rejeição de cada uma ('' = válida).
+
+    Uma linha é válida quando tem 15 dezenas inteiras e distintas entre 1 e 25 e o número do
+    concurso é inteiro e maior que o de todas as linhas anteriores.
+
+    Args:
+      concursos: array float com o número do concurso de cada linha (NaN se ilegível).
+      matriz: array float (linhas x 15) com as dezenas.
+      ultimo_concurso: maior concurso aceito nos blocos anteriores.
+    """
+    validos = validar_matriz(matriz)
+    distintas = contar_bits(matriz_para_mascaras(matriz)) == DEZENAS_POR_SORTEIO
+    concurso_valido = np.isfinite(concursos) & (concursos == np.floor(concursos))
+    # Só linhas aceitas elevam o máximo. Uma linha que só falharia pela ordem nunca supera o
+    # máximo já aceito, então basta acumular o máximo das linhas válidas nos demais critérios.
+    candidatas = concurso_valido & validos.all(axis=1) & distintas
+    anteriores = np.maximum.accumulate(np.concatenate([[ultimo_concurso], np.where(candidatas, concursos, -np.inf)]))
+    em_ordem = concursos > anteriores[:-1]
+
+    motivos = np.full(len(concursos), '', dtype=object)
+    motivos[~distintas] = 'dezenas_repetidas'
+    motivos[~validos.all(axis=1)] = 'dezena_invalida'
+    motivos[~em_ordem] = 'concurso_fora_de_ordem'
+    motivos[~concurso_valido] = 'concurso_invalido'
+    return motivos
+
+
+def ler_csv_em_blocos(caminho_arquivo, tamanho_bloco=100_000, relatorio_rejeitados=None):
+    """Lê o CSV de resultados em blocos, validando cada linha, e gera as máscaras das válidas.
+
+    Args:
+      caminho_arquivo: CSV com o concurso na coluna 0 e as bolas nas colunas 2 a 16.
+      tamanho_bloco: linhas lidas por vez; a memória usada não depende do tamanho do arquivo.
+      relatorio_rejeitados: caminho opcional de um CSV (linha, concurso, motivo) com as linhas
+        rejeitadas. Só é criado se houver rejeições.
+
+    Yields:
+      Arrays uint32 com as máscaras das linhas válidas de cada bloco.
+    """
+    import csv
+    import pandas as pd
+
+    ultimo_concurso = -np.inf
+    linha_inicial = 2  # Linha 1 do arquivo é o cabeçalho
+    relatorio = None
+    try:
+        for bloco in pd.read_csv(caminho_arquivo, chunksize=tamanho_bloco):
+            if bloco.shape[1] < 17:
+                raise ValueError(f"{caminho_arquivo}: esperadas ao menos 17 colunas, encontradas {bloco.shape[1]}")
+            concursos = pd.to_numeric(bloco.iloc[:, 0], errors='coerce').to_numpy(dtype=np.float64)
+            matriz = bloco.iloc[:, 2:17].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64,
+                                                                                     na_value=np.nan)
+            motivos = motivos_rejeicao(concursos, matriz, ultimo_concurso)
+            aceitas = motivos == ''
+            if not aceitas.all() and relatorio_rejeitados is not None:
+                if relatorio is None:
+                    relatorio = open(relatorio_rejeitados, 'w', newline='', encoding='utf-8')
+                    escritor = csv.writer(relatorio)
+                    escritor.writerow(['linha', 'concurso', 'motivo'])
+                for indice in np.flatnonzero(~aceitas):
+                    escritor.writerow([linha_inicial + indice, bloco.iat[indice, 0], motivos[indice]])
+            ultimo_concurso = max(ultimo_concurso, np.max(concursos[aceitas], initial=-np.inf))
+            linha_inicial += len(bloco)
+            yield matriz_para_mascaras(matriz[aceitas])
+    finally:
+        if relatorio is not None:
+            relatorio.close()
+
+
+def caminho_cache(caminho_arquivo):
+    """Caminho do arquivo binário de cache associado ao CSV."""
+    return caminho_arquivo + '.mascaras'
+
+
+def caminho_rejeitados(caminho_arquivo):
+    """Caminho do relatório de linhas rejeitadas na leitura do CSV."""
+    return caminho_arquivo + '.rejeitados.csv'
+
+
+def _cabecalho(tamanho, mtime, quantidade):
+    """Bytes do cabeçalho do armazém de máscaras."""
+    cabecalho = np.zeros(1, dtype=_CABECALHO)
+    cabecalho['identificador'] = _IDENTIFICADOR
+    cabecalho['tamanho'] = tamanho
+    cabecalho['mtime'] = mtime
+    cabecalho['quantidade'] = quantidade
+    return cabecalho.tobytes()
+
+
+def _ler_cabecalho(caminho):
+    """Lê e confere o cabeçalho de um armazém; devolve None se o arquivo faltar ou estiver corrompido."""
+    try:
+        cabecalho = np.fromfile(caminho, dtype=_CABECALHO, count=1)
+    except (FileNotFoundError, ValueError):
+        return None
+    if len(cabecalho) != 1 or cabecalho['identificador'][0] != _IDENTIFICADOR:
+        return None
+    if os.path.getsize(caminho) != _CABECALHO.itemsize + 4 * int(cabecalho['quantidade'][0]):
+        return None
+    return cabecalho[0]
+
+
+def _mapear(caminho, quantidade):
+    """Mapeia em memória as `quantidade` máscaras gravadas após o cabeçalho."""
+    if quantidade == 0:
+        return np.zeros(0, dtype=np.uint32)
+    return np.memmap(caminho, dtype='<u4', mode='r', offset=_CABECALHO.itemsize, shape=(quantidade,))
+
+
+def gravar_armazem(caminho, blocos, tamanho=0, mtime=0):
+    """Grava um armazém a partir de um iterável de blocos de máscaras, sem juntá-los em memória.
+
+    O arquivo é escrito em um temporário e só substitui o destino quando completo.
+
+    Returns:
+      Quantidade de máscaras gravadas.
+    """
+    temporario = f'{caminho}.{os.getpid()}.tmp'
+    quantidade = 0
+    try:
+        with open(temporario, 'wb') as arquivo:
+            arquivo.write(_cabecalho(tamanho, mtime, 0))
+            for bloco in blocos:
+                arquivo.write(np.asarray(bloco, dtype='<u4').tobytes())
+                quantidade += len(bloco)
+            arquivo.seek(0)
+            arquivo.write(_cabecalho(tamanho, mtime, quantidade))
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return quantidade
+
+
+def anexar_mascaras(caminho, mascaras):
+    """Acrescenta máscaras ao fim de um armazém (criado se não existir) e atualiza o cabeçalho."""
+    cabecalho = _ler_cabecalho(caminho)
+    if cabecalho is None:
+        gravar_armazem(caminho, [mascaras])
+        return
+    quantidade = int(cabecalho['quantidade']) + len(mascaras)
+    with open(caminho, 'r+b') as arquivo:
+        arquivo.seek(0, os.SEEK_END)
+        arquivo.write(np.asarray(mascaras, dtype='<u4').tobytes())
+        arquivo.seek(0)
+        arquivo.write(_cabecalho(int(cabecalho['tamanho']), int(cabecalho['mtime']), quantidade))
+
+
+def abrir_armazem(caminho):
+    """Mapeia em memória as máscaras de um armazém; levanta ValueError se ele for inválido."""
+    cabecalho = _ler_cabecalho(caminho)
+    if cabecalho is None:
+        raise ValueError(f"Armazém de máscaras inválido: {caminho}")
+    return _mapear(caminho, int(cabecalho['quantidade']))
+
+
+def ler_cache(caminho, tamanho, mtime):
+    """Mapeia o arquivo de cache em memória, ou devolve None se ele não corresponder ao CSV."""
+    cabecalho = _ler_cabecalho(caminho)
+    if cabecalho is None or cabecalho['tamanho'] != tamanho or cabecalho['mtime'] != mtime:
+        return None
+    return _mapear(caminho, int(cabecalho['quantidade']))
+
+
+@perfil.cronometrado
+def ingerir_csv(caminho_arquivo, caminho_destino, tamanho_bloco=100_000, relatorio_rejeitados=None):
+    """Converte um CSV de qualquer tamanho em armazém de máscaras, bloco a bloco.
+
+    Returns:
+      Quantidade de sorteios válidos gravados.
+    """
+    info = os.stat(caminho_arquivo)
+    blocos = ler_csv_em_blocos(caminho_arquivo, tamanho_bloco, relatorio_rejeitados)
+    return gravar_armazem(caminho_destino, blocos, info.st_size, info.st_mtime_ns)
+
+
+@perfil.cronometrado
+def carregar_mascaras(caminho_arquivo, usar_cache=True):
+    """Carrega os sorteios do CSV como array uint32 de máscaras de 25 bits.
+
+    O CSV só é relido quando o tamanho ou a data de modificação mudam; caso contrário as
+    máscaras vêm do arquivo de cache, mapeado em memória. A leitura é feita em blocos e as
+    linhas inválidas são descartadas e listadas em caminho_rejeitados(caminho_arquivo).
+    Levanta FileNotFoundError se o CSV não existir.
+    """
+    info = os.stat(caminho_arquivo)
+    cache = caminho_cache(caminho_arquivo)
+    rejeitados = caminho_rejeitados(caminho_arquivo)
+    if usar_cache:
+        mascaras = ler_cache(cache, info.st_size, info.st_mtime_ns)
+        if mascaras is not None:
+            perfil.contar('sorteios.cache_acertos')
+            return mascaras
+        perfil.contar('sorteios.cache_falhas')
+        if os.path.exists(rejeitados):
+            os.remove(rejeitados)
+        try:
+            ingerir_csv(caminho_arquivo, cache, relatorio_rejeitados=rejeitados)
+            return abrir_armazem(cache)
+        except OSError:
+            pass  # Diretório somente leitura: segue sem cache.
+
+    blocos = list(ler_csv_em_blocos(caminho_arquivo))
+    return np.concatenate(blocos) if blocos else np.zeros(0, dtype=np.uint32)
@@ -0,0 +1,241 @@
+import numpy as np
+from . import sorteios
+
+# Popcount de um int do Python (int.bit_count só existe a partir do 3.10).
+_contar = getattr(int, 'bit_count', None) or (lambda valor: bin(valor).count('1'))
+
+_TODOS = (1 << sorteios.NUMEROS) - 1
+
+
+def _mascara(valor):
+    """Máscara de 25 bits de uma combinação, de uma máscara (int) ou de uma sequência de números."""
+    if isinstance(valor, Combinacao):
+        return valor.mascara
+    if isinstance(valor, (int, np.integer)):
+        return int(valor)
+    return sorteios.codificar_sorteio(valor)
+
+
+class Combinacao:
+    """Conjunto imutável de números de 1 a 25 guardado como um único inteiro de 25 bits.
+
+    Pertinência, acertos (popcount da interseção), hash e igualdade custam O(1); soma, pares,
+    linhas e colunas são calculados da máscara quando pedidos. Use Sorteio e Aposta, que
+    conferem a quantidade de números.
+    """
+
+    __slots__ = ('mascara',)
+    MINIMO, MAXIMO = 0, sorteios.NUMEROS
+
+    def __init__(self, numeros):
+        """Aceita uma sequência de números (1 a 25), uma máscara de 25 bits ou outra Combinacao."""
+        mascara = _mascara(numeros)
+        if not 0 <= mascara <= _TODOS:
+            raise ValueError(f"Máscara fora de 25 bits: {mascara}")
+        if not isinstance(numeros, (int, np.integer, Combinacao)) and _contar(mascara) != len(numeros):
+            raise ValueError(f"Números repetidos ou fora de 1 a 25: {list(numeros)}")
+        if not self.MINIMO <= _contar(mascara) <= self.MAXIMO:
+            raise ValueError(f"{type(self).__name__} exige de {self.MINIMO} a {self.MAXIMO} números, "
+                             f"recebeu {_contar(mascara)}")
+        object.__setattr__(self, 'mascara', mascara)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __reduce__(self):
+        return type(self), (self.mascara,)
+
+    def __contains__(self, numero):
+        return 1 <= numero <= sorteios.NUMEROS and bool(self.mascara >> (numero - 1) & 1)
+
+    def __iter__(self):
+        return iter(sorteios.decodificar_mascara(self.mascara))
+
+    def __len__(self):
+        return _contar(self.mascara)
+
+    def __int__(self):
+        return self.mascara
+
+    def __hash__(self):
+        return hash(self.mascara)
+
+    def __eq__(self, outra):
+        if isinstance(outra, Combinacao):
+            return self.mascara == outra.mascara
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.numeros})"
+
+    @property
+    def numeros(self):
+        """Lista ordenada dos números."""
+        return sorteios.decodificar_mascara(self.mascara)
+
+    def acertos(self, outra):
+        """Quantidade de números em comum com outra combinação (ou máscara, ou lista de números)."""
+        return _contar(self.mascara & _mascara(outra))
+
+    @property
+    def soma(self):
+        return sum(self)
+
+    @property
+    def pares(self):
+        return _contar(self.mascara & 0xAAAAAA)  # bits 1, 3, ... = números 2, 4, ..., 24
+
+    @property
+    def impares(self):
+        return len(self) - self.pares
+
+    @property
+    def linhas(self):
+        """Quantidade de números em cada linha do volante ((num - 1) // 5), como tupla de 5."""
+        return tuple(_contar(self.mascara >> (5 * linha) & 0x1F) for linha in range(5))
+
+    @property
+    def colunas(self):
+        """Quantidade de números em cada coluna ((num - 1) % 10), como tupla de 10 (ver sorteios.linhas_colunas)."""
+        return tuple(sum(self.mascara >> bit & 1 for bit in range(coluna, sorteios.NUMEROS, 10))
+                     for coluna in range(10))
+
+
+class Sorteio(Combinacao):
+    """Resultado de um concurso: exatamente 15 números."""
+
+    __slots__ = ()
+    MINIMO = MAXIMO = sorteios.DEZENAS_POR_SORTEIO
+
+
+class Aposta(Combinacao):
+    """Aposta da Lotofácil: de 15 a 20 números."""
+
+    __slots__ = ()
+    MINIMO, MAXIMO = sorteios.DEZENAS_POR_SORTEIO, 20
+
+
+class ColecaoCombinacoes:
+    """Sequência imutável de combinações guardada como um array uint32 contíguo (4 bytes cada).
+
+    Os elementos só viram objetos (Sorteio, Aposta) quando acessados um a um; np.asarray(colecao)
+    devolve as máscaras sem cópia, então as funções que recebem máscaras (sorteios.para_mascaras,
+    ConferenciaHistorica, jogo, padroes, ...) aceitam a coleção diretamente. A quantidade de
+    números de cada elemento não é conferida na criação (lotes podem ter apostas incompletas,
+    ver LoteApostas).
+    """
+
+    __slots__ = ('mascaras',)
+    ELEMENTO = Combinacao
+
+    def __init__(self, mascaras=()):
+        """Aceita máscaras, uma matriz de dezenas, listas de números ou combinações."""
+        if isinstance(mascaras, ColecaoCombinacoes):
+            mascaras = mascaras.mascaras
+        elif isinstance(mascaras, (list, tuple)) and not len(mascaras):
+            mascaras = np.zeros(0, dtype=np.uint32)
+        else:
+            mascaras = sorteios.para_mascaras(mascaras)
+        mascaras = np.ascontiguousarray(mascaras, dtype=np.uint32)
+        if mascaras.flags.writeable:
+            # Cópia própria somente leitura (o array de quem chamou continua alterável)
+            mascaras = mascaras.copy()
+            mascaras.flags.writeable = False
+        object.__setattr__(self, 'mascaras', mascaras)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __reduce__(self):
+        return type(self), (np.array(self.mascaras),)
+
+    def __len__(self):
+        return len(self.mascaras)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, (int, np.integer)):
+            return self._elemento(int(self.mascaras[indice]))
+        return type(self)(self.mascaras[indice])
+
+    def __iter__(self):
+        return map(self._elemento, self.mascaras.tolist())
+
+    def _elemento(self, mascara):
+        return self.ELEMENTO(mascara)
+
+    def __contains__(self, combinacao):
+        return bool(np.any(self.mascaras == _mascara(combinacao)))
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return self.mascaras.astype(dtype or self.mascaras.dtype)
+        if copy is False and dtype is not None and np.dtype(dtype) != self.mascaras.dtype:
+            raise ValueError(f"Converter para {np.dtype(dtype)} exige uma cópia")
+        return self.mascaras if dtype is None else self.mascaras.astype(dtype, copy=False)
+
+    def __eq__(self, outra):
+        if isinstance(outra, ColecaoCombinacoes):
+            return np.array_equal(self.mascaras, outra.mascaras)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} combinações)"
+
+    @property
+    def nbytes(self):
+        return self.mascaras.nbytes
+
+    def matriz(self):
+        """Matriz uint8 (combinações x 15) com os números em ordem crescente."""
+        return sorteios.mascaras_para_matriz(self.mascaras)
+
+    def quantidades(self):
+        """Quantidade de números de cada combinação (array uint8)."""
+        return sorteios.contar_bits(self.mascaras).astype(np.uint8)
+
+    def acertos(self, combinacao):
+        """Acertos de cada elemento contra uma combinação (popcount vetorizado, array uint8)."""
+        return sorteios.contar_bits(self.mascaras & np.uint32(_mascara(combinacao))).astype(np.uint8)
+
+    def somas(self):
+        return sorteios.mascaras_para_incidencia(self.mascaras) @ np.arange(1, sorteios.NUMEROS + 1)
+
+    def pares_impares(self):
+        """Array uint8 (combinações x 2) com [pares, ímpares], como jogo.calcular_pares_impares."""
+        pares = sorteios.contar_bits(self.mascaras & np.uint32(0xAAAAAA)).astype(np.uint8)
+        return np.stack([pares, self.quantidades() - pares], axis=1)
+
+    def linhas_colunas(self):
+        """Histogramas por linha e coluna de cada elemento (ver sorteios.linhas_colunas)."""
+        return sorteios.linhas_colunas(sorteios.mascaras_para_incidencia(self.mascaras))
+
+
+class Historico(ColecaoCombinacoes):
+    """Sorteios em ordem cronológica; o array pode ser o armazém mapeado em memória."""
+
+    __slots__ = ()
+    ELEMENTO = Sorteio
+
+    @classmethod
+    def carregar(cls, caminho_arquivo):
+        """Histórico do CSV de resultados (ver sorteios.carregar_mascaras)."""
+        return cls(sorteios.carregar_mascaras(caminho_arquivo))
+
+
+class LoteApostas(ColecaoCombinacoes):
+    """Lote de apostas, como devolvido por jogo.gerar_lote_*(..., formato='apostas').
+
+    Apostas incompletas (menos de 15 números, como as de gerar_lote_por_distribuicao com poucas
+    linhas e colunas) são devolvidas como Combinacao, pois não formam uma Aposta válida; use
+    quantidades() para separá-las.
+    """
+
+    __slots__ = ()
+    ELEMENTO = Aposta
+
+    def _elemento(self, mascara):
+        if _contar(mascara) < Aposta.MINIMO:
+            return Combinacao(mascara)
+        return Aposta(mascara)